@@ -6,21 +6,22 @@ Purpose: Django项目初始化脚本，用于创建符合最佳实践的项目
 """
 
 import datetime
+import functools
 import re
 import os
 import sys
-import shutil
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import argparse
+from string import Template
 
 # 初始应用列表配置（当没有通过命令行指定应用时使用）
 INITIAL_APPS = [
     'main',  # 默认主应用，表示系统的主要功能
 ]
 
-# 禁止使用的应用名列表
-FORBIDDEN_APP_NAMES = [
+# 禁止使用的应用名集合（只用于成员判断）
+FORBIDDEN_APP_NAMES = frozenset([
     'admin',  # Django内置管理后台
     'auth',  # Django认证系统
     'contenttypes',  # Django内容类型系统
@@ -28,7 +29,7 @@ FORBIDDEN_APP_NAMES = [
     'messages',  # Django消息系统
     'staticfiles',  # Django静态文件系统
     'sites',  # Django站点框架
-]
+])
 
 # 建议的替代名称映射
 APP_NAME_SUGGESTIONS = {
@@ -52,13 +53,9 @@ def check_forbidden_app_names(app_names):
     if app_names is None:
         return False, [], {}
 
-    forbidden_names = []
-    suggestions = {}
-
-    for app_name in app_names:
-        if app_name in FORBIDDEN_APP_NAMES:
-            forbidden_names.append(app_name)
-            suggestions[app_name] = APP_NAME_SUGGESTIONS.get(app_name, [f'custom_{app_name}'])
+    forbidden_names = [app_name for app_name in app_names if app_name in FORBIDDEN_APP_NAMES]
+    suggestions = {app_name: APP_NAME_SUGGESTIONS.get(app_name, [f'custom_{app_name}'])
+                   for app_name in forbidden_names}
 
     return bool(forbidden_names), forbidden_names, suggestions
 
@@ -66,20 +63,67 @@ def check_forbidden_app_names(app_names):
 MODE_INIT = 'init'      # 初始化模式
 MODE_ADD_APP = 'add'    # 增加应用模式
 
+# 开发指南默认输出文件名
+DEFAULT_GUIDE_OUTPUT = 'app_development_guide.md'
 
-def get_default_project_name():
+
+def get_default_project_name(cwd=None):
     """获取默认项目名（当前目录名）"""
-    return Path.cwd().name
+    if cwd is None:
+        cwd = Path.cwd()
+    return cwd.name
+
 
+def check_project_exists(project_name, parent_dir=None):
+    """检查项目是否已存在
 
-def check_project_exists(project_name):
-    """检查项目是否已存在"""
-    project_dir = Path.cwd() / project_name
+    Args:
+        project_name (str): 项目名称
+        parent_dir (Path, optional): 项目所在目录. 默认为当前目录
+    """
+    if parent_dir is None:
+        parent_dir = Path.cwd()
+    project_dir = parent_dir / project_name
     return project_dir.exists()
 
 
-def parse_arguments():
-    """解析命令行参数"""
+def get_guide_only_output(argv):
+    """
+    判断命令行是否只请求输出开发指南（--guide [--guide-output 文件名]）
+
+    此时无需导入argparse和构建完整的参数解析器
+
+    Args:
+        argv: 命令行参数列表（不含脚本名）
+
+    Returns:
+        str: 指南输出文件名；如果不是单纯的指南请求则返回None
+    """
+    has_guide = False
+    output = DEFAULT_GUIDE_OUTPUT
+    args = iter(argv)
+    for arg in args:
+        if arg == '--guide':
+            has_guide = True
+        elif arg == '--guide-output':
+            output = next(args, None)
+            if output is None or output.startswith('-'):
+                return None
+        elif arg.startswith('--guide-output='):
+            output = arg.split('=', 1)[1]
+        else:
+            return None
+    return output if has_guide and output else None
+
+
+def parse_arguments(cwd=None):
+    """解析命令行参数
+
+    Args:
+        cwd (Path, optional): 当前工作目录，用于确定默认项目名
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Django项目初始化/应用添加脚本',
         epilog='''
@@ -91,6 +135,7 @@ def parse_arguments():
           # 在现有项目中添加应用:
           python django_project_init.py --mode add -p myproject -a newapp1 newapp2
           python django_project_init.py --mode add -a newapp --auto-update
+          python django_project_init.py --mode add -a newapp --auto-update -v  # 输出逐步调试信息
 
           # 还原配置到最新备份:
           python django_project_init.py --restore              # 在项目内执行
@@ -135,14 +180,20 @@ def parse_arguments():
 
     # 开发指南输出文件名参数
     parser.add_argument('--guide-output',
-                        default='app_development_guide.md',
-                        help='开发指南输出文件名(默认: app_development_guide.md)')
+                        default=DEFAULT_GUIDE_OUTPUT,
+                        help=f'开发指南输出文件名(默认: {DEFAULT_GUIDE_OUTPUT})')
 
     parser.add_argument('--no-rest-swagger',
                         action='store_true',
                         default=False,
                         help='不添加REST Framework和Swagger配置')
 
+    # 调试输出参数
+    parser.add_argument('-v', '--verbose',
+                        action='store_true',
+                        default=False,
+                        help='输出配置更新的逐步调试信息')
+
     args = parser.parse_args()
 
     # 当使用restore时,不需要检查其他参数
@@ -156,88 +207,340 @@ def parse_arguments():
 
     # 如果没有指定项目名,使用当前目录名
     if args.project is None:
-        args.project = get_default_project_name()
+        args.project = get_default_project_name(cwd)
 
     return args
 
 
+# 输出日志缓冲区（文件/目录创建、结果汇总等），由flush_log()一次性写出，减少逐行print的stdout写入
+# 缓冲区按线程隔离，并行创建多个应用时各应用的日志保持连续
+_log_state = threading.local()
+_stdout_lock = threading.Lock()
+
+# 并行创建应用时的最大线程数
+MAX_APP_WORKERS = 8
+
+# 并行创建项目配置文件时的最大线程数
+MAX_FILE_WORKERS = 8
+
+# 是否输出配置更新的逐步调试信息（默认只输出结果和错误）
+DEBUG_VERBOSE = False
+
+
+def log(message):
+    """记录一条日志到当前线程的缓冲区"""
+    buffer = getattr(_log_state, 'buffer', None)
+    if buffer is None:
+        buffer = _log_state.buffer = []
+    buffer.append(message)
+
+
+def debug(message):
+    """输出逐步调试信息，仅在DEBUG_VERBOSE开启时写到stdout"""
+    if DEBUG_VERBOSE:
+        print(message)
+
+
+def take_log():
+    """取出并清空当前线程缓冲的日志，工作线程的日志由此按顺序交回调用线程"""
+    buffer = getattr(_log_state, 'buffer', None)
+    if not buffer:
+        return []
+    _log_state.buffer = []
+    return buffer
+
+
+def flush_log():
+    """将当前线程缓冲的日志一次性写到stdout"""
+    buffer = getattr(_log_state, 'buffer', None)
+    if buffer:
+        with _stdout_lock:
+            sys.stdout.write('\n'.join(buffer) + '\n')
+        buffer.clear()
+
+
 def create_directory(path):
     """创建目录，如果目录不存在"""
     try:
         os.makedirs(path, exist_ok=True)
-        print(f"? 创建目录: {path}")
+        log(f"? 创建目录: {path}")
     except Exception as e:
-        print(f"? 创建目录失败 {path}: {str(e)}")
+        log(f"? 创建目录失败 {path}: {str(e)}")
         return False
     return True
 
 
-def create_file(path, content=''):
-    """创建文件，如果文件不存在"""
+def create_directories(paths):
+    """批量创建目录：去重后只创建叶子目录，中间目录由makedirs一并创建"""
+    paths = {Path(path) for path in paths}
+    ancestors = {parent for path in paths for parent in path.parents}
+    success = True
+    for path in sorted(paths - ancestors):
+        if not create_directory(path):
+            success = False
+    return success
+
+
+def open_dir_fd(path):
+    """打开目录描述符，供mkdirat/openat以相对路径创建子目录和文件
+
+    平台不支持dir_fd或打开失败时返回None，调用方此时改用完整路径。
+    """
+    if os.open not in os.supports_dir_fd:
+        return None
     try:
-        if not os.path.exists(path):
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"? 创建文件: {path}")
-        else:
-            print(f"! 文件已存在: {path}")
-    except Exception as e:
-        print(f"? 创建文件失败 {path}: {str(e)}")
-        return False
-    return True
+        return os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:
+        return None
 
 
-def create_app_structure(app_name, project_name, base_dir):
-    """创建应用的完整目录结构和文件"""
-    normalized_app_name = normalize_app_name(app_name)
-    class_name = get_app_class_name(normalized_app_name)
+def create_directory_tree(root, paths, dir_fd=None):
+    """在本次新建的空目录root下批量创建目录
 
-    app_dir = base_dir / 'apps' / app_name
+    root下还没有任何目录，无需makedirs逐级检查是否存在：补全中间目录后按层级由浅到深
+    依次mkdir，每个目录只有一次系统调用；支持dir_fd时通过root的目录描述符（mkdirat）
+    以相对路径创建，不必每次从头解析完整路径。
 
-    # 创建应用基础目录
-    directories = [
-        'migrations',  # [Django必需] 数据库迁移文件目录
-        'core',  # [自定义] 核心业务逻辑目录 - 存放所有与Django无关的业务逻辑、算法、数据处理等代码
-        # MVF目录 - 每个都有自己的__init__.py
-        'models',  # 存放所有模型定义文件
-        'views',  # 存放所有视图处理文件
-        'serializers',  # 存放所有序列化器文件
-        'forms',  # 存放所有表单定义文件
-        f'templates/{app_name}',  # [Django] 应用级HTML模板目录
-        f'templates/{app_name}/components',  # [Django] 可重用的模板组件目录
-        f'static/{app_name}/css',  # [Django] CSS样式文件目录
-        f'static/{app_name}/js',  # [Django] JavaScript文件目录
-        f'static/{app_name}/images',  # [Django] 图片资源目录
-        'services',  # [Django集成] 服务层目录 - 主要用于连接core层和Django层的facade服务
-        'helpers',  # [Django集成] 辅助函数目录 - 处理Django相关的工具函数
-        'api',  # [Django REST] REST API相关代码目录
-        'tests/test_services',  # [测试] 服务层测试目录
-        'management/commands',  # [Django] 自定义管理命令目录
-    ]
+    Args:
+        root: 新建的根目录
+        paths: 要创建的目录路径
+        dir_fd: 可选，调用方已打开的root目录描述符；未提供时在函数内打开并关闭
+    """
+    root = Path(root)
+    relative = {Path(path).relative_to(root) for path in paths}
+    ancestors = {parent for path in relative for parent in path.parents}
+    leaves = relative - ancestors
+    all_dirs = (relative | ancestors) - {Path('.')}
+
+    own_fd = dir_fd is None
+    if own_fd:
+        dir_fd = open_dir_fd(root)
+    success = True
+    try:
+        for path in sorted(all_dirs, key=lambda path: (len(path.parts), path)):
+            try:
+                if dir_fd is None:
+                    os.mkdir(root / path)
+                else:
+                    os.mkdir(path, dir_fd=dir_fd)
+            except FileExistsError:
+                pass
+            except OSError as e:
+                log(f"? 创建目录失败 {root / path}: {str(e)}")
+                success = False
+                continue
+            if path in leaves:
+                log(f"? 创建目录: {root / path}")
+    finally:
+        if own_fd and dir_fd is not None:
+            os.close(dir_fd)
+    return success
 
-    # 确保基础目录创建成功
-    if not create_directory(app_dir):
-        return False
 
-    success = True  # 添加成功标志
+def scan_existing_files(root, existing_dirs=None):
+    """用os.scandir一次性遍历目录树，返回已存在文件路径的集合
 
-    for directory in directories:
-        if not create_directory(app_dir / directory):
-            success = False
+    Args:
+        root: 要遍历的根目录
+        existing_dirs: 可选，传入集合时同时收集遍历到的子目录路径
+    """
+    existing = set()
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        if existing_dirs is not None:
+                            existing_dirs.add(entry.path)
+                    else:
+                        existing.add(entry.path)
+        except OSError:
             continue
-        # 修改：优化__init__.py创建逻辑
-        if not any(directory.startswith(prefix) for prefix in ['templates/', 'static/']):
-            if not create_file(app_dir / directory / '__init__.py',
-                               f'"""\nFile: apps/{app_name}/{directory}/__init__.py\nPurpose: {directory}包的初始化文件\n"""\n'):
-                success = False
+    return existing
 
-    # 添加MVF目录的示例文件
-    mvf_examples = {
-        'models/base.py': f'''"""
-File: apps/{app_name}/models/base.py
-Purpose: 基础数据模型定义
-"""
 
+def read_text_file(path):
+    """整体读取UTF-8文本文件
+
+    换行符统一为\\n，与文本模式读取结果一致。
+    """
+    # Path.read_bytes按文件大小一次分配缓冲区，整个文件通常一次read系统调用即可读完，
+    # 不受文本模式默认8 KiB缓冲区或文件系统st_blksize的影响
+    return decode_text(Path(path).read_bytes())
+
+
+def decode_text(data):
+    """将读取到的UTF-8字节解码为文本，换行符统一为\\n"""
+    content = data.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def encode_text(content):
+    """将文本编码为写入文件的UTF-8字节，换行符按平台转换，与文本模式写入结果一致"""
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode('utf-8')
+
+
+def write_text_file(path, content):
+    """整体覆盖写入文本文件
+
+    一次性编码后用单次write_bytes写出，省去文本层和缓冲层的额外拷贝。
+    """
+    Path(path).write_bytes(encode_text(content))
+
+
+def replace_text_file(path, content):
+    """原子地覆盖写入文本文件
+
+    先完整写入同目录下的临时文件，再用os.replace一次性替换目标文件；
+    写入中途出错时目标文件保持原样，无需再从备份恢复。
+    临时文件由mkstemp创建后直接用os.write写出，替换前只做一次fsync，
+    保证替换后的文件内容已落盘，系统崩溃时不会留下空文件。
+    目标为符号链接时替换其指向的文件，替换后保留原文件的权限位；
+    临时文件名由mkstemp生成，不会覆盖同目录下的其他文件。
+    """
+    # 只在更新配置时用到，按需导入以免拖慢其他运行路径的启动
+    import tempfile
+
+    path = os.path.realpath(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp',
+                                    dir=os.path.dirname(path))
+    try:
+        data = memoryview(encode_text(content))
+        try:
+            try:
+                mode = os.stat(path).st_mode & 0o7777
+            except FileNotFoundError:
+                # 目标文件不存在时使用与普通创建文件相同的默认权限
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, mode)
+            else:
+                os.chmod(tmp_path, mode)
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_new_file(path, content, dir_fd=None):
+    """独占创建文件并写入内容，文件已存在时抛出FileExistsError
+
+    直接使用os.open/os.write/os.close，每个文件只有打开、写入、关闭三次系统调用，
+    省去内置open()构建文本层和缓冲层时额外的fstat、ioctl、lseek。
+    content为文本时按encode_text编码；为bytes时视为已编码，直接写出；
+    为bytes片段的元组时用os.writev一次写出，无需先在Python中拼接。
+    提供dir_fd时path为相对于该目录描述符的路径（openat）。
+    """
+    if isinstance(content, tuple):
+        chunks = content
+    else:
+        chunks = (content if isinstance(content, bytes) else encode_text(content),)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666,
+                 dir_fd=dir_fd)
+    try:
+        if len(chunks) > 1 and hasattr(os, 'writev'):
+            written = os.writev(fd, chunks)
+            if written == sum(map(len, chunks)):
+                return
+            data = memoryview(b''.join(chunks))[written:]
+        else:
+            data = memoryview(b''.join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def create_file(path, content='', existing=None, dir_fd=None, relative_path=None):
+    """创建文件，如果文件不存在
+
+    Args:
+        path: 文件路径
+        content: 文件内容
+        existing: 可选，scan_existing_files()返回的已存在文件集合，命中时不再访问文件系统；
+            创建（或发现已存在）的文件会加入该集合，保持与文件系统一致
+        dir_fd: 可选，所在根目录的目录描述符，与relative_path一起提供时通过openat创建文件
+        relative_path: 可选，文件相对于dir_fd的路径
+    """
+    path_key = os.fspath(path)
+    if existing is not None and path_key in existing:
+        log(f"! 文件已存在: {path}")
+        return True
+    try:
+        # 使用独占创建模式，省去单独的存在性检查
+        if dir_fd is not None and relative_path is not None:
+            write_new_file(relative_path, content, dir_fd)
+        else:
+            write_new_file(path, content)
+        log(f"? 创建文件: {path}")
+    except FileExistsError:
+        log(f"! 文件已存在: {path}")
+    except Exception as e:
+        log(f"? 创建文件失败 {path}: {str(e)}")
+        return False
+    if existing is not None:
+        existing.add(path_key)
+    return True
+
+
+def file_header(path, purpose, warning=None):
+    """生成文件头部的标准说明文档字符串（File/Purpose/Warning）"""
+    lines = ['"""', f'File: {path}', f'Purpose: {purpose}']
+    if warning:
+        lines.append(f'Warning: {warning}')
+    lines.append('"""\n')
+    return '\n'.join(lines)
+
+
+def render_app_path(file_path, app_name):
+    """替换应用文件相对路径中的占位符（路径中只会出现${app_name}）"""
+    return file_path.replace('${app_name}', app_name)
+
+
+# 应用中的Python包目录，每个都有自己的__init__.py（模板和静态文件目录不是Python包，按应用名另行创建）
+APP_PACKAGE_DIRS = (
+    'migrations',  # [Django必需] 数据库迁移文件目录
+    'core',  # [自定义] 核心业务逻辑目录 - 存放所有与Django无关的业务逻辑、算法、数据处理等代码
+    # MVF目录
+    'models',  # 存放所有模型定义文件
+    'views',  # 存放所有视图处理文件
+    'serializers',  # 存放所有序列化器文件
+    'forms',  # 存放所有表单定义文件
+    'services',  # [Django集成] 服务层目录 - 主要用于连接core层和Django层的facade服务
+    'helpers',  # [Django集成] 辅助函数目录 - 处理Django相关的工具函数
+    'api',  # [Django REST] REST API相关代码目录
+    'tests/test_services',  # [测试] 服务层测试目录
+    'management/commands',  # [Django] 自定义管理命令目录
+)
+
+# 应用包__init__.py的文件头（与file_header的输出格式一致）：
+# 公共前缀 + 应用名 + 各目录的固定部分，目录部分在模块加载时编码一次
+INIT_STUB_HEAD = encode_text('"""\nFile: apps/')
+INIT_STUB_TAILS = tuple(
+    (directory, encode_text(f'/{directory}/__init__.py\nPurpose: {directory}包的初始化文件\n"""\n'))
+    for directory in APP_PACKAGE_DIRS
+)
+
+# MVF目录（models/views/serializers/forms）的基础示例文件模板
+# 可用变量: app_name, app_title, project_name
+APP_MVF_TEMPLATES = [
+    ('models/base.py', Template(file_header('apps/${app_name}/models/base.py', '基础数据模型定义') + '''
 from django.db import models
 
 class BaseModel(models.Model):
@@ -247,13 +550,9 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
-''',
-
-        'views/base.py': f'''"""
-File: apps/{app_name}/views/base.py
-Purpose: 基础视图定义
-"""
+''')),
 
+    ('views/base.py', Template(file_header('apps/${app_name}/views/base.py', '基础视图定义') + '''
 from django.shortcuts import render
 from django.views import View
 
@@ -262,18 +561,15 @@ class BaseView(View):
     template_name = None
 
     def get_context_data(self, **kwargs):
-        context = {{
-            'title': '{app_name.title()}',
-            'project_name': '{project_name}'
-        }}
+        context = {
+            'title': '${app_title}',
+            'project_name': '${project_name}'
+        }
         context.update(kwargs)
         return context
-''',
-        'serializers/base.py': f'''"""
-File: apps/{app_name}/serializers/base.py
-Purpose: 基础序列化器定义
-"""
+''')),
 
+    ('serializers/base.py', Template(file_header('apps/${app_name}/serializers/base.py', '基础序列化器定义') + '''
 from rest_framework import serializers
 
 class BaseModelSerializer(serializers.ModelSerializer):
@@ -286,13 +582,9 @@ class BaseModelSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         """通用验证钩子"""
         return super().validate(attrs)
-''',
-
-        'forms/base.py': f'''"""
-File: apps/{app_name}/forms/base.py
-Purpose: 基础表单定义
-"""
+''')),
 
+    ('forms/base.py', Template(file_header('apps/${app_name}/forms/base.py', '基础表单定义') + '''
 from django import forms
 
 class BaseForm(forms.Form):
@@ -300,193 +592,68 @@ class BaseForm(forms.Form):
     def clean(self):
         cleaned_data = super().clean()
         return cleaned_data
-'''
-    }
-    # 创建MVF示例文件
-    for file_path, content in mvf_examples.items():
-        if not create_file(app_dir / file_path, content):
-            success = False
-
-    # 添加init文件
-    mvf_examples.update({
-        'models/__init__.py': f'''"""
-File: apps/{app_name}/models/__init__.py
-Purpose: 汇总导出所有模型
-"""
-from apps.{normalized_app_name}.models.base import BaseModel
-''',
-
-        'views/__init__.py': f'''"""
-File: apps/{app_name}/views/__init__.py
-Purpose: 汇总导出所有视图
-"""
-from apps.{normalized_app_name}.views.base import BaseView
-''',
-
-        'forms/__init__.py': f'''"""
-File: apps/{app_name}/forms/__init__.py
-Purpose: 汇总导出所有表单
-"""
-from apps.{normalized_app_name}.forms.base import BaseForm
-'''
-    })
-
-    # 举个实际模块的例子
-    if app_name == 'data_processor':  # 假设这是数据处理应用
-        mvf_examples.update({
-            'models/excel_data.py': f'''"""
-File: apps/{app_name}/models/excel_data.py
-Purpose: Excel数据模型定义
-"""
-
-from .base import BaseModel
-
-class ExcelData(BaseModel):
-    """Excel数据模型"""
-    file_name = models.CharField(max_length=255, verbose_name='文件名')
-    sheet_name = models.CharField(max_length=100, verbose_name='工作表名')
-    row_count = models.IntegerField(verbose_name='行数')
-    # 其他字段...
-''',
-
-            'views/excel_processor.py': f'''"""
-File: apps/{app_name}/views/excel_processor.py
-Purpose: Excel处理视图
-"""
-
-from apps.{normalized_app_name}.views.base import BaseView
-from apps.{normalized_app_name}.services.excel_service import ExcelService
-
-class ExcelUploadView(BaseView):
-    template_name = '{app_name}/excel_upload.html'
-
-    def post(self, request):
-        service = ExcelService()
-        result = service.process_upload(request.FILES['file'])
-        return JsonResponse(result)
-''',
-
-            'forms/excel_upload.py': f'''"""
-File: apps/{app_name}/forms/excel_upload.py
-Purpose: Excel上传表单
-"""
-
-from .base import BaseForm
-
-class ExcelUploadForm(BaseForm):
-    file = forms.FileField(label='Excel文件')
-    sheet_name = forms.CharField(label='工作表名', required=False)
-
-    def clean_file(self):
-        file = self.cleaned_data['file']
-        if not file.name.endswith(('.xlsx', '.xls')):
-            raise forms.ValidationError('请上传Excel文件')
-        return file
-'''
-        })
-
-    normalized_app_name = normalize_app_name(app_name)
-    class_name = get_app_class_name(normalized_app_name)
-
-    # 创建应用基础文件
-    files = {
-        '__init__.py': f'"""\nFile: apps/{normalized_app_name}/__init__.py\nPurpose: {normalized_app_name}应用的初始化文件\n"""\n',
+''')),
+]
 
-        'apps.py': f'''"""
-File: apps/{normalized_app_name}/apps.py
-Purpose: {normalized_app_name}应用的配置类
-Warning: 此文件由系统自动生成，请勿手动修改
-"""
+# 应用基础文件模板（模块加载时编译一次，创建应用时只做变量替换）
+# 可用变量: app_name, app_title, project_name, normalized_app_name, class_name, verbose_name
+APP_FILE_TEMPLATES = [
+    ('__init__.py', Template(file_header('apps/${normalized_app_name}/__init__.py', '${normalized_app_name}应用的初始化文件'))),
 
+    ('apps.py', Template(file_header('apps/${normalized_app_name}/apps.py', '${normalized_app_name}应用的配置类', '此文件由系统自动生成，请勿手动修改') + '''
 from django.apps import AppConfig
 
-class {class_name}Config(AppConfig):
+class ${class_name}Config(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.{normalized_app_name}'
-    verbose_name = '{normalized_app_name.title().replace("_", " ")}模块'
-''',
-
-        'urls.py': f'''"""
-File: apps/{normalized_app_name}/urls.py
-Purpose: {normalized_app_name}应用的URL配置
-"""
+    name = 'apps.${normalized_app_name}'
+    verbose_name = '${verbose_name}模块'
+''')),
 
+    ('urls.py', Template(file_header('apps/${normalized_app_name}/urls.py', '${normalized_app_name}应用的URL配置') + '''
 from django.urls import path
-from apps.{normalized_app_name}.views.base import BaseView
+from apps.${normalized_app_name}.views.base import BaseView
 
-app_name = '{normalized_app_name}'
+app_name = '${normalized_app_name}'
 
 urlpatterns = [
     path('', BaseView.as_view(), name='index'),
 ]
-''',
-
-        'admin.py': f'''"""
-File: apps/{app_name}/admin.py
-Purpose: {app_name}应用的后台管理配置
-"""
+''')),
 
+    ('admin.py', Template(file_header('apps/${app_name}/admin.py', '${app_name}应用的后台管理配置') + '''
 from django.contrib import admin
 # Register your models here.
-''',
-
-        'constants.py': f'''"""
-File: apps/{app_name}/constants.py
-Purpose: {app_name}应用的常量定义
-"""
+''')),
 
+    ('constants.py', Template(file_header('apps/${app_name}/constants.py', '${app_name}应用的常量定义') + '''
 # Application-specific constants
-''',
+''')),
 
-        'exceptions.py': f'''"""
-File: apps/{app_name}/exceptions.py
-Purpose: {app_name}应用的自定义异常
-"""
-
-class {app_name.title()}Error(Exception):
-    """Base exception for {app_name} app"""
+    ('exceptions.py', Template(file_header('apps/${app_name}/exceptions.py', '${app_name}应用的自定义异常') + '''
+class ${app_title}Error(Exception):
+    """Base exception for ${app_name} app"""
     pass
-''',
-
-        'utils.py': f'''"""
-File: apps/{app_name}/utils.py
-Purpose: {app_name}应用的工具函数
-"""
+''')),
 
+    ('utils.py', Template(file_header('apps/${app_name}/utils.py', '${app_name}应用的工具函数') + '''
 # Utility functions
-''',
-
-        'services/data_service.py': f'''"""
-File: apps/{app_name}/services/data_service.py
-Purpose: {app_name}应用的数据服务
-"""
+''')),
 
+    ('services/data_service.py', Template(file_header('apps/${app_name}/services/data_service.py', '${app_name}应用的数据服务') + '''
 # Data service functions
-''',
-
-        'helpers/formatters.py': f'''"""
-File: apps/{app_name}/helpers/formatters.py
-Purpose: {app_name}应用的格式化助手函数
-"""
+''')),
 
+    ('helpers/formatters.py', Template(file_header('apps/${app_name}/helpers/formatters.py', '${app_name}应用的格式化助手函数') + '''
 # Formatting helper functions
-''',
-
-        'api/views.py': f'''"""
-File: apps/{app_name}/api/views.py
-Purpose: {app_name}应用的API视图
-"""
+''')),
 
+    ('api/views.py', Template(file_header('apps/${app_name}/api/views.py', '${app_name}应用的API视图') + '''
 from rest_framework import viewsets
 
 # API Views
-''',
-
-        'api/urls.py': f'''"""
-File: apps/{app_name}/api/urls.py
-Purpose: {app_name}应用的API路由配置
-"""
+''')),
 
+    ('api/urls.py', Template(file_header('apps/${app_name}/api/urls.py', '${app_name}应用的API路由配置') + '''
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
@@ -496,23 +663,15 @@ router = DefaultRouter()
 urlpatterns = [
     path('', include(router.urls)),
 ]
-''',
-
-        'tests/test_models.py': f'''"""
-File: apps/{app_name}/tests/test_models.py
-Purpose: {app_name}应用的模型测试
-"""
+''')),
 
+    ('tests/test_models.py', Template(file_header('apps/${app_name}/tests/test_models.py', '${app_name}应用的模型测试') + '''
 from django.test import TestCase
 
 # Model tests
-''',
-
-        'tests/test_views.py': f'''"""
-File: apps/{app_name}/tests/test_views.py
-Purpose: {app_name}应用的视图测试
-"""
+''')),
 
+    ('tests/test_views.py', Template(file_header('apps/${app_name}/tests/test_views.py', '${app_name}应用的视图测试') + '''
 from django.test import TestCase, Client
 
 class ViewTests(TestCase):
@@ -520,82 +679,63 @@ class ViewTests(TestCase):
         self.client = Client()
 
     def test_index_view(self):
-        response = self.client.get('/{app_name}/')
+        response = self.client.get('/${app_name}/')
         self.assertEqual(response.status_code, 200)
-''',
-
-        'tests/test_services/test_data_service.py': f'''"""
-File: apps/{app_name}/tests/test_services/test_data_service.py
-Purpose: {app_name}应用的服务测试
-"""
+''')),
 
+    ('tests/test_services/test_data_service.py', Template(file_header('apps/${app_name}/tests/test_services/test_data_service.py', '${app_name}应用的服务测试') + '''
 from django.test import TestCase
 
 # Service tests
-''',
-
-        'management/commands/process_data.py': f'''"""
-File: apps/{app_name}/management/commands/process_data.py
-Purpose: {app_name}应用的示例管理命令
-"""
+''')),
 
+    ('management/commands/process_data.py', Template(file_header('apps/${app_name}/management/commands/process_data.py', '${app_name}应用的示例管理命令') + '''
 from django.core.management.base import BaseCommand
 
 class Command(BaseCommand):
-    help = '处理{app_name}数据的示例命令'
+    help = '处理${app_name}数据的示例命令'
 
     def add_arguments(self, parser):
         parser.add_argument('--action', type=str, help='要执行的操作')
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('命令执行成功'))
-''',
+''')),
 
-        f'templates/{app_name}/base.html': f'''{{% extends "../base.html" %}}
+    ('templates/${app_name}/base.html', Template('''{% extends "../base.html" %}
 
-{{% block title %}}{app_name.title()} - {{{{project_name}}}}{{% endblock %}}
+{% block title %}${app_title} - {{project_name}}{% endblock %}
 
-{{% block content %}}
-{{% endblock %}}
-''',
+{% block content %}
+{% endblock %}
+''')),
 
-        f'templates/{app_name}/index.html': f'''{{% extends "{app_name}/base.html" %}}
+    ('templates/${app_name}/index.html', Template('''{% extends "${app_name}/base.html" %}
 
-{{% block title %}}{{{{title}}}}{{% endblock %}}
+{% block title %}{{title}}{% endblock %}
 
-{{% block content %}}
+{% block content %}
 <div class="container mx-auto px-4 py-8">
-    <h1 class="text-3xl font-bold mb-4">{{{{title}}}}</h1>
-    {{% if app_name == "main" %}}<p class="text-lg">欢迎使用 {{{{project_name}}}} 系统</p>{{% endif %}}
+    <h1 class="text-3xl font-bold mb-4">{{title}}</h1>
+    {% if app_name == "main" %}<p class="text-lg">欢迎使用 {{project_name}} 系统</p>{% endif %}
 </div>
-{{% endblock %}}
-''',
-
-        f'templates/{app_name}/components/header.html': '''{% load static %}
-
-<header class="main-header">
-    <nav class="container mx-auto px-4 py-2">
-        <!-- Header content -->
-    </nav>
-</header>
-''',
-
-        f'static/{app_name}/css/style.css': '''/* Application specific styles */
-''',
-
-        f'static/{app_name}/js/main.js': '''// Application specific JavaScript
-''',
-        'bootstrap.py': f'''"""
-File: apps/{app_name}/bootstrap.py
-Purpose: 应用启动器，用于设置Python导入路径和项目关键常量
-"""
+{% endblock %}
+''')),
 
+    ('bootstrap.py', Template(file_header('apps/${app_name}/bootstrap.py', '应用启动器，用于设置Python导入路径和项目关键常量') + '''
+import functools
 import os
 import sys
 from typing import Tuple, Optional, Set, List
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_absolute_path(path: str) -> str:
+    """标准化绝对路径，结果按原字符串缓存（绝对路径的结果与当前工作目录无关）"""
+    return os.path.normpath(path)
+
+
 class PathManager:
     """路径管理器，处理Python导入路径的添加和去重"""
 
@@ -610,7 +750,12 @@ class PathManager:
 
     @staticmethod
     def _normalize_path(path: str) -> str:
-        """标准化路径格式，确保路径比较的一致性"""
+        """标准化路径格式，确保路径比较的一致性
+
+        sys.path中绝大多数是绝对路径，其结果走缓存；相对路径依赖当前工作目录，每次重新计算
+        """
+        if os.path.isabs(path):
+            return _normalize_absolute_path(path)
         return os.path.normpath(os.path.abspath(path))
 
     def add_paths(self, *paths: str) -> List[str]:
@@ -624,7 +769,7 @@ class PathManager:
             List[str]: 实际添加的路径列表（排除重复的）
         """
         # 标准化所有输入路径
-        normalized_paths = {{self._normalize_path(p) for p in paths}}
+        normalized_paths = {self._normalize_path(p) for p in paths}
 
         # 排除已经初始化过的路径
         new_paths = normalized_paths - self._initialized_paths
@@ -632,24 +777,21 @@ class PathManager:
         if not new_paths:
             return []
 
-        # 移除可能存在的重复路径（考虑不同形式的相同路径）
-        for path in list(sys.path):
-            norm_path = self._normalize_path(path)
-            if norm_path in new_paths:
-                sys.path.remove(path)
+        # 添加的路径（顺序与逐个插入到开头时一致）
+        added_paths = list(new_paths)
 
-        # 添加新路径到sys.path开头
-        added_paths = []
-        for path in new_paths:  # 使用new_paths而不是paths_to_add
-            sys.path.insert(0, path)
-            added_paths.append(path)
-            self._initialized_paths.add(path)
+        # 一次重建sys.path：移除可能存在的重复路径（考虑不同形式的相同路径），
+        # 再把新路径整体放到开头，避免逐个remove/insert反复移动列表
+        sys.path[:] = added_paths[::-1] + [
+            path for path in sys.path if self._normalize_path(path) not in new_paths
+        ]
+        self._initialized_paths.update(new_paths)
 
         return added_paths
 
     def get_current_paths(self) -> Set[str]:
         """获取当前的Python导入路径集合（标准化后的）"""
-        return {{self._normalize_path(path) for path in sys.path}}
+        return {self._normalize_path(path) for path in sys.path}
 
     def get_initialized_paths(self) -> Set[str]:
         """获取所有已经初始化过的路径"""
@@ -664,6 +806,10 @@ def _get_env_path(env_var: str, default: Optional[str] = None) -> Optional[str]:
     return default
 
 
+# setup_paths()首次成功后的结果，之后的调用直接返回
+_SETUP_RESULT: Optional[Tuple[str, str]] = None
+
+
 def setup_paths() -> Tuple[str, str]:
     """
     设置应用级别和项目级别的Python导入路径
@@ -671,11 +817,16 @@ def setup_paths() -> Tuple[str, str]:
     Returns:
         Tuple[str, str]: (应用根目录路径, 项目根目录路径)
     """
+    global _SETUP_RESULT
+    if _SETUP_RESULT is not None:
+        return _SETUP_RESULT
+
     # 首先尝试从环境变量获取路径
     app_root = _get_env_path('APP_ROOT')
     project_root = _get_env_path('PROJECT_ROOT')
+    from_env = bool(app_root and project_root)
 
-    if not all([app_root, project_root]):
+    if not from_env:
         # 获取当前文件所在目录（应用根目录）
         app_root = os.path.dirname(os.path.abspath(__file__))
 
@@ -689,16 +840,18 @@ def setup_paths() -> Tuple[str, str]:
     app_root = path_manager._normalize_path(app_root)
     project_root = path_manager._normalize_path(project_root)
 
-    # 验证目录是否存在
-    if not all(os.path.isdir(d) for d in (app_root, project_root)):
+    # 验证目录是否存在（路径来自环境变量且设置了BOOTSTRAP_TRUST_ENV时信任环境变量，跳过检查）
+    trust_env = from_env and os.environ.get('BOOTSTRAP_TRUST_ENV')
+    if not trust_env and not all(os.path.isdir(d) for d in (app_root, project_root)):
         raise RuntimeError(
-            f"Invalid paths - app_root: {{app_root}}, project_root: {{project_root}}"
+            f"Invalid paths - app_root: {app_root}, project_root: {project_root}"
         )
 
     # 使用PathManager添加路径
     path_manager.add_paths(project_root, app_root)
 
-    return app_root, project_root
+    _SETUP_RESULT = (app_root, project_root)
+    return _SETUP_RESULT
 
 
 # 在模块导入时自动执行路径设置
@@ -751,41 +904,174 @@ if __name__ == '__main__':
 
     print(f"Current Configuration:")
     print(f"=====================")
-    print(f"Project Root: {{PROJECT_ROOT}}")
-    print(f"Apps Dir: {{APPS_DIR}}")
-    print(f"App Root: {{APP_ROOT}}")
-    print(f"App Name: {{get_app_name()}}")
+    print(f"Project Root: {PROJECT_ROOT}")
+    print(f"Apps Dir: {APPS_DIR}")
+    print(f"App Root: {APP_ROOT}")
+    print(f"App Name: {get_app_name()}")
 
     print(f"\\nInitialized Paths:")
     print(f"=================")
     for path in sorted(path_manager.get_initialized_paths()):
-        print(f"  - {{path}}")
+        print(f"  - {path}")
 
     print(f"\\nPython Path:")
     print(f"============")
     for path in sorted(path_manager.get_current_paths()):
-        print(f"  - {{path}}")
-''',
-        'APP_DEVELOPMENT_GUIDE.md': get_app_development_guide(),
-    }
+        print(f"  - {path}")
+''')),
+]
 
-    for file_path, content in files.items():
-        if not create_file(app_dir / file_path, content):
-            success = False
 
+# 内容固定、无需变量替换的应用文件（路径中的$app_name仍需替换）
+APP_STATIC_FILES = [
+    ('templates/${app_name}/components/header.html', '''{% load static %}
 
-    return success
+<header class="main-header">
+    <nav class="container mx-auto px-4 py-2">
+        <!-- Header content -->
+    </nav>
+</header>
+'''),
 
+    ('static/${app_name}/css/style.css', '''/* Application specific styles */
+'''),
 
-def get_app_development_guide():
-    """获取应用开发指南内容"""
-    return '''# Django应用开发规范指南
+    ('static/${app_name}/js/main.js', '''// Application specific JavaScript
+'''),
+]
 
-## 1. 目录结构与职责
 
-### 1.1 核心业务目录 (core/)
-- 用途：存放所有与Django无关的业务逻辑
-- 特点：可独立运行、测试和复用
+def create_app_structure(app_name, project_name, base_dir):
+    """创建应用的完整目录结构和文件"""
+    # 应用名的各种派生形式只计算一次
+    normalized_app_name = normalize_app_name(app_name)
+    class_name = get_app_class_name(normalized_app_name)
+    app_title = app_name.title()
+    context = {
+        'app_name': app_name,
+        'app_title': app_title,
+        'project_name': project_name,
+        'normalized_app_name': normalized_app_name,
+        'class_name': class_name,
+        'verbose_name': normalized_app_name.title().replace('_', ' '),
+    }
+
+    app_dir = base_dir / 'apps' / app_name
+
+    # 创建应用基础目录：Python包目录（见APP_PACKAGE_DIRS）加上按应用名区分的模板和静态文件目录
+    directories = [
+        *APP_PACKAGE_DIRS,
+        f'templates/{app_name}',  # [Django] 应用级HTML模板目录
+        f'templates/{app_name}/components',  # [Django] 可重用的模板组件目录
+        f'static/{app_name}/css',  # [Django] CSS样式文件目录
+        f'static/{app_name}/js',  # [Django] JavaScript文件目录
+        f'static/{app_name}/images',  # [Django] 图片资源目录
+    ]
+
+    # 先单独创建应用根目录，以得知它是否为本次新建
+    try:
+        app_dir.mkdir(parents=True)
+        is_new_app_dir = True
+    except OSError:
+        is_new_app_dir = False
+
+    # 打开应用目录的目录描述符，之后的目录和文件都以相对路径通过mkdirat/openat创建，
+    # 不必每次从头解析完整路径
+    app_fd = open_dir_fd(app_dir)
+    try:
+        # 汇总所有目录及文件所在目录，去重后一次性创建；新建的应用目录下无需逐级检查
+        needed_dirs = {app_dir / directory for directory in directories}
+        needed_dirs.update((app_dir / render_app_path(file_path, app_name)).parent
+                           for file_path, _ in (*APP_FILE_TEMPLATES, *APP_STATIC_FILES))
+        if is_new_app_dir:
+            success = create_directory_tree(app_dir, needed_dirs, app_fd)  # 添加成功标志
+            # 新建的目录中不会有文件，无需扫描
+            existing = set()
+        else:
+            # 已有应用目录：一次遍历获取已存在的目录和文件，已存在的目录不再逐个makedirs，
+            # 之后的文件也只做集合查找，重复运行时几乎不再逐个访问文件系统
+            existing_dirs = {os.fspath(app_dir)}
+            existing = scan_existing_files(app_dir, existing_dirs)
+            success = create_directories(path for path in needed_dirs if os.fspath(path) not in existing_dirs)
+
+        # 确保基础目录创建成功（目录描述符打开成功时已可确认）
+        if app_fd is None and not app_dir.is_dir():
+            return False
+
+        # 循环中频繁调用的全局函数绑定到局部变量，减少全局查找
+        _substitute = Template.substitute
+        _render_app_path = render_app_path
+
+        def create_app_file(relative_path, content):
+            """在应用目录下创建文件，relative_path为相对于应用目录的路径"""
+            return create_file(app_dir / relative_path, content, existing, app_fd, relative_path)
+
+        # __init__.py的文件头由公共前缀、应用名和预先编码的目录部分组成，各片段由writev一次写出
+        app_name_bytes = encode_text(app_name)
+        for directory, init_tail in INIT_STUB_TAILS:
+            if not create_app_file(f'{directory}/__init__.py', (INIT_STUB_HEAD, app_name_bytes, init_tail)):
+                success = False
+
+        # 创建MVF目录的示例文件（模板在模块加载时构建，这里只做替换）
+        for file_path, template in APP_MVF_TEMPLATES:
+            if not create_app_file(file_path, _substitute(template, context)):
+                success = False
+
+        # 创建应用基础文件
+        for file_path, template in APP_FILE_TEMPLATES:
+            file_path = _render_app_path(file_path, app_name)
+            if not create_app_file(file_path, _substitute(template, context)):
+                success = False
+
+        for file_path, content in APP_STATIC_FILES:
+            file_path = _render_app_path(file_path, app_name)
+            if not create_app_file(file_path, content):
+                success = False
+
+        if not create_app_file('APP_DEVELOPMENT_GUIDE.md', APP_DEVELOPMENT_GUIDE_DATA):
+            success = False
+    finally:
+        if app_fd is not None:
+            os.close(app_fd)
+
+    return success
+
+
+def create_app_structures(app_names, project_name, base_dir):
+    """
+    创建多个应用的目录结构，各应用之间相互独立，使用线程池并行创建
+
+    Returns:
+        list: 与app_names顺序对应的创建结果
+    """
+    if len(app_names) <= 1:
+        results = [create_app_structure(app_name, project_name, base_dir) for app_name in app_names]
+        flush_log()
+        return results
+
+    def create_one(app_name):
+        """创建单个应用，返回(创建结果, 该应用产生的日志)"""
+        return create_app_structure(app_name, project_name, base_dir), take_log()
+
+    results = []
+    with ThreadPoolExecutor(max_workers=min(MAX_APP_WORKERS, len(app_names))) as executor:
+        # 按app_names的顺序输出各应用的日志，与串行创建时一致
+        for result, messages in executor.map(create_one, app_names):
+            results.append(result)
+            for message in messages:
+                log(message)
+            flush_log()
+    return results
+
+
+# 应用开发指南内容（静态文本，模块加载时构建一次，各应用共享）
+APP_DEVELOPMENT_GUIDE = '''# Django应用开发规范指南
+
+## 1. 目录结构与职责
+
+### 1.1 核心业务目录 (core/)
+- 用途：存放所有与Django无关的业务逻辑
+- 特点：可独立运行、测试和复用
 - 适合内容：
   * 数据处理算法
   * 业务逻辑
@@ -1097,190 +1383,34 @@ A: 文件处理逻辑放在服务层，只传递文件路径给core层。
 5. 安全考虑
 '''
 
-def create_project_structure(project_name):
-    """创建项目的完整目录结构和文件"""
-    base_dir = Path.cwd() / project_name
+# 开发指南的文件字节在模块加载时编码一次，创建各应用时直接写出，不再逐个应用编码
+APP_DEVELOPMENT_GUIDE_DATA = encode_text(APP_DEVELOPMENT_GUIDE)
 
-    # 处理应用列表配置
-    app_configs = []
-    if INITIAL_APPS:
-        for app in INITIAL_APPS:
-            app_configs.append(f"    'apps.{app}.apps.{app.title().replace('_', '')}Config',")
-
-    # 创建项目根目录
-    if not create_directory(base_dir):
-        return False
 
-    # 切换到项目目录
-    os.chdir(base_dir)
+def render_app_registrations(app_names):
+    """渲染应用在INSTALLED_APPS和urlpatterns中的条目
 
-    # 创建基本目录结构
-    directories = [
-        'config/settings',
-        'apps',
-        'static/css',
-        'static/js',
-        'static/images',
-        'templates/shared',
-        'media/uploads',
-        'docs',
-        'common',
-        'requirements',
+    Returns:
+        tuple: (INSTALLED_APPS条目行列表, urlpatterns条目行列表)
+    """
+    app_configs = [f"    'apps.{app}.apps.{app.title().replace('_', '')}Config',"
+                   for app in app_names]
+    url_lines = [
+        # 主应用作为根URL
+        "    path('', include('apps.main.urls')),  # 主应用作为根URL\n" if app == 'main'
+        else f"    path('{app}/', include('apps.{app}.urls')),\n"
+        for app in app_names
     ]
+    return app_configs, url_lines
 
-    # 创建目录并添加__init__.py
-    for directory in directories:
-        path = Path(directory)
-        create_directory(path)
-        if directory in ['apps', 'common', 'config', 'config/settings']:
-            create_file(path / '__init__.py',
-                        f'"""\nFile: {directory}/__init__.py\nPurpose: {directory}包的初始化文件\n"""\n')
-
-    # 构建模板目录列表
-    templates_dirs = ["            BASE_DIR / 'templates'"]
-    for app in INITIAL_APPS:
-        templates_dirs.append(f"            BASE_DIR / 'apps' / '{app}' / 'templates'")
-    templates_str = ',\n'.join(templates_dirs)
-
-    # 创建配置文件
-    settings_base = f'''"""
-File: config/settings/base.py
-Purpose: Django项目基础配置文件
-Warning: 此文件包含关键项目配置，修改前请仔细评估影响
-"""
-
-from pathlib import Path
-import os
-import sys
-from .logging_config import LOGGING
-
-# Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-
-# 添加apps目录到Python路径
-sys.path.append(str(BASE_DIR))
-sys.path.append(str(BASE_DIR / 'apps'))
-
-# Quick-start development settings - unsuitable for production
-# See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
-
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-your-secret-key-here'
-
-# Application definition
-INSTALLED_APPS = [
-    'django.contrib.admin',
-    'django.contrib.auth',
-    'django.contrib.contenttypes',
-    'django.contrib.sessions',
-    'django.contrib.messages',
-    'django.contrib.staticfiles',
-    'rest_framework',
-    'rest_framework.authtoken',
-    'drf_yasg',  # Swagger/OpenAPI文档
-{chr(10).join(app_configs) if app_configs else ''}
-]
-
-MIDDLEWARE = [
-    'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-]
-
-ROOT_URLCONF = 'config.urls'
-
-TEMPLATES = [
-    {{
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [
-{templates_str}
-        ],
-        'APP_DIRS': True,
-        'OPTIONS': {{
-            'context_processors': [
-                'django.template.context_processors.debug',
-                'django.template.context_processors.request',
-                'django.contrib.auth.context_processors.auth',
-                'django.contrib.messages.context_processors.messages',
-            ],
-        }},
-    }},
-]
-
-WSGI_APPLICATION = 'config.wsgi.application'
-
-# Database
-DATABASES = {{
-    'default': {{
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }}
-}}
-
-# Password validation
-AUTH_PASSWORD_VALIDATORS = [
-    {{'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'}},
-    {{'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'}},
-    {{'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'}},
-    {{'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'}},
-]
-
-# Internationalization
-LANGUAGE_CODE = 'zh-hans'
-TIME_ZONE = 'Asia/Shanghai'
-USE_I18N = True
-USE_TZ = True
-
-# Static files (CSS, JavaScript, Images)
-STATIC_URL = 'static/'
-STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_DIRS = [
-    BASE_DIR / 'static',
-]
-
-MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
-
-# Default primary key field type
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-# REST Framework配置
-REST_FRAMEWORK = {{
-    'DEFAULT_PERMISSION_CLASSES': [
-        'rest_framework.permissions.AllowAny',  # 开发阶段允许所有访问
-    ],
-    # 新增认证类配置
-    'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
-        'rest_framework.authentication.SessionAuthentication',
-    ],
-    'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema',
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 10,
-}}
+# 项目中需要__init__.py的包目录
+PROJECT_PACKAGE_DIRS = ('config/settings', 'apps', 'common')
 
-# Swagger配置
-SWAGGER_SETTINGS = {{
-    'USE_SESSION_AUTH': False,  # 禁用session认证
-    'JSON_EDITOR': True,        # 启用JSON编辑器
-    'SECURITY_DEFINITIONS': {{
-        'Basic': {{
-            'type': 'basic'
-        }},
-        'Bearer': {{
-            'type': 'apiKey',
-            'name': 'Authorization',
-            'in': 'header'
-        }}
-    }},
-}}
-'''
 
-    settings_local = '''"""
+# 项目骨架中内容固定的文件，模块加载时构建并编码为字节一次，创建项目时直接写出
+# config/settings/local.py
+SETTINGS_LOCAL_PY = encode_text('''"""
 File: config/settings/local.py
 Purpose: Django项目本地开发配置文件
 """
@@ -1304,9 +1434,11 @@ MIDDLEWARE = ['debug_toolbar.middleware.DebugToolbarMiddleware'] + MIDDLEWARE
 INTERNAL_IPS = [
     '127.0.0.1',
 ]
-'''
+''')
+
 
-    settings_production = '''"""
+# config/settings/production.py
+SETTINGS_PRODUCTION_PY = encode_text('''"""
 File: config/settings/production.py
 Purpose: Django项目生产环境配置文件
 """
@@ -1321,9 +1453,11 @@ ALLOWED_HOSTS = ['your-domain.com']  # 修改为实际域名
 SECURE_SSL_REDIRECT = True
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
-'''
+''')
+
 
-    manage_py = '''#!/usr/bin/env python
+# manage.py
+MANAGE_PY = encode_text('''#!/usr/bin/env python
 """
 File: manage.py
 Purpose: Django项目管理脚本，提供命令行工具
@@ -1347,9 +1481,11 @@ def main():
 
 if __name__ == '__main__':
     main()
-'''
+''')
+
 
-    wsgi_py = '''"""
+# config/wsgi.py
+WSGI_PY = encode_text('''"""
 File: config/wsgi.py
 Purpose: WSGI配置，用于生产环境部署
 Warning: 此文件由系统自动生成，请谨慎修改
@@ -1360,9 +1496,11 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.production')
 application = get_wsgi_application()
-'''
+''')
+
 
-    asgi_py = '''"""
+# config/asgi.py
+ASGI_PY = encode_text('''"""
 File: config/asgi.py
 Purpose: ASGI配置，用于异步服务器部署
 Warning: 此文件由系统自动生成，请谨慎修改
@@ -1373,9 +1511,11 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.production')
 application = get_asgi_application()
-'''
+''')
+
 
-    urls_py = '''"""
+# config/urls.py的开头部分（应用URL之前）
+URLS_PY_HEAD = '''"""
 File: config/urls.py
 Purpose: 项目的主URL配置
 """
@@ -1409,16 +1549,9 @@ urlpatterns = [
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
 '''
 
-    # 动态添加URL配置
-    for app in INITIAL_APPS:
-        # 主应用作为根URL
-        if app == 'main':
-            urls_py += f"    path('', include('apps.main.urls')),  # 主应用作为根URL\n"
-        else:
-            urls_py += f"    path('{app}/', include('apps.{app}.urls')),\n"
 
-    # 添加结尾部分
-    urls_py += ''']
+# config/urls.py的结尾部分（应用URL之后）
+URLS_PY_TAIL = ''']
 
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1429,27 +1562,35 @@ if settings.DEBUG:
         pass
 '''
 
-    requirements_base = '''# 基础依赖包
+
+# requirements/base.txt
+REQUIREMENTS_BASE = encode_text('''# 基础依赖包
 Django>=5.0.8
 python-dotenv>=1.0.0
 Pillow>=10.0.0
 djangorestframework>=3.14.0
-'''
+''')
 
-    requirements_local = '''# 本地开发依赖包
+
+# requirements/local.txt
+REQUIREMENTS_LOCAL = encode_text('''# 本地开发依赖包
 -r base.txt
 django-debug-toolbar>=4.2.0
 django-extensions>=3.2.3
 ipython>=8.12.2
-'''
+''')
 
-    requirements_production = '''# 生产环境依赖包
+
+# requirements/production.txt
+REQUIREMENTS_PRODUCTION = encode_text('''# 生产环境依赖包
 -r base.txt
 gunicorn>=21.2.0
 psycopg2-binary>=2.9.9
-'''
+''')
 
-    gitignore = '''# Python
+
+# .gitignore
+GITIGNORE = encode_text('''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -1493,151 +1634,50 @@ ENV/
 # Project specific
 /media/
 /static/
-'''
+''')
 
-    readme = f'''# {project_name}
 
-## 项目设置
+# .env
+ENV_FILE = encode_text('''# 环境变量配置
+DEBUG=True
+SECRET_KEY=your-secret-key-here
+DATABASE_URL=sqlite:///db.sqlite3
+''')
 
-1. 创建虚拟环境:
-```bash
-python -m venv venv
-source venv/bin/activate  # Linux/Mac
-venv\\Scripts\\activate  # Windows
-```
 
-2. 安装依赖:
-```bash
-pip install -r requirements/local.txt
-```
+# templates/base.html
+BASE_HTML = encode_text('''<!DOCTYPE html>
+<html lang="zh-hans">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{% block title %}{{project_name}}{% endblock %}</title>
+    {% load static %}
+    <link rel="stylesheet" href="{% static 'css/style.css' %}">
+</head>
+<body>
+    <header>
+        {% include "shared/header.html" %}
+    </header>
 
-3. 初始化数据库:
-```bash
-python manage.py migrate
-```
+    <main>
+        {% block content %}
+        {% endblock %}
+    </main>
 
-4. 创建超级用户:
-```bash
-python manage.py createsuperuser
-```
+    <footer>
+        {% include "shared/footer.html" %}
+    </footer>
 
-5. 运行开发服务器:
-```bash
-python manage.py runserver
-```
+    <script src="{% static 'js/main.js' %}"></script>
+    {% block extra_js %}{% endblock %}
+</body>
+</html>
+''')
 
-## 项目结构
 
-```
-{project_name}/
-├── manage.py           # Django命令行工具
-├── config/             # 项目配置
-│   ├── settings/      # 分环境配置
-│   ├── urls.py       # URL配置
-│   ├── wsgi.py      # WSGI配置
-│   └── asgi.py     # ASGI配置
-├── apps/             # 应用目录
-├── templates/        # 项目级模板
-├── static/           # 静态文件
-├── media/            # 上传文件
-├── docs/            # 文档
-│   ├── api.md                  # API接口文档
-│   ├── deployment.md           # 部署文档
-│   ├── api_design_guide.md     # API设计指南(精简版)
-│   └── django_rest_api_lightweight_specification_and_implementation_guide.md # API设计指南(完整版)
-└── requirements/     # 依赖管理
-```
-
-## 环境配置
-
-1. 开发环境:
-```bash
-export DJANGO_SETTINGS_MODULE=config.settings.local
-```
-
-2. 生产环境:
-```bash
-export DJANGO_SETTINGS_MODULE=config.settings.production
-```
-
-## 应用说明
-
-1. main: 系统主要功能模块
-2. [其他应用说明]
-
-## 开发指南
-
-### 创建新应用
-
-```bash
-python manage.py startapp your_app_name apps/your_app_name
-```
-
-### 运行测试
-
-```bash
-python manage.py test
-```
-
-### 收集静态文件
-
-```bash
-python manage.py collectstatic
-```
-
-## API文档
-
-API文档位于 `docs/api.md`
-
-## 部署指南
-
-详细部署说明请参考 `docs/deployment.md`
-
-## 开发团队
-
-[填写开发团队信息]
-
-## 许可证
-
-[选择适当的许可证]
-'''
-
-    env = '''# 环境变量配置
-DEBUG=True
-SECRET_KEY=your-secret-key-here
-DATABASE_URL=sqlite:///db.sqlite3
-'''
-
-    base_html = '''<!DOCTYPE html>
-<html lang="zh-hans">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{% block title %}{{project_name}}{% endblock %}</title>
-    {% load static %}
-    <link rel="stylesheet" href="{% static 'css/style.css' %}">
-</head>
-<body>
-    <header>
-        {% include "shared/header.html" %}
-    </header>
-
-    <main>
-        {% block content %}
-        {% endblock %}
-    </main>
-
-    <footer>
-        {% include "shared/footer.html" %}
-    </footer>
-
-    <script src="{% static 'js/main.js' %}"></script>
-    {% block extra_js %}{% endblock %}
-</body>
-</html>
-'''
-
-    shared_header = '''<header class="site-header">
+# templates/shared/header.html
+SHARED_HEADER_HTML = encode_text('''<header class="site-header">
     <nav>
         <ul>
             <li><a href="{% url 'admin:index' %}">管理后台</a></li>
@@ -1645,14 +1685,18 @@ DATABASE_URL=sqlite:///db.sqlite3
         </ul>
     </nav>
 </header>
-'''
+''')
+
 
-    shared_footer = '''<footer class="site-footer">
+# templates/shared/footer.html
+SHARED_FOOTER_HTML = encode_text('''<footer class="site-footer">
     <p>&copy; {% now "Y" %} {{project_name}}. All rights reserved.</p>
 </footer>
-'''
+''')
+
 
-    api_md = '''# API文档
+# docs/api.md
+API_MD = encode_text('''# API文档
 
 ## 概述
 
@@ -1695,9 +1739,11 @@ GET /api/v1/example/
     "code": "错误代码"
 }
 ```
-'''
+''')
 
-    deployment_md = '''# 部署文档
+
+# docs/deployment.md
+DEPLOYMENT_MD = encode_text('''# 部署文档
 
 ## 系统要求
 
@@ -1822,9 +1868,11 @@ sudo systemctl restart gunicorn
 2. 定期更新依赖
 3. 启用防火墙
 4. 定期备份
-'''
+''')
+
 
-    common_helpers = '''"""
+# common/helpers.py
+COMMON_HELPERS_PY = encode_text('''"""
 File: common/helpers.py
 Purpose: 项目级通用工具函数
 """
@@ -1847,9 +1895,11 @@ def truncate_string(text, length=100, suffix='...'):
     if len(text) <= length:
         return text
     return text[:length].rsplit(' ', 1)[0] + suffix
-'''
+''')
+
 
-    common_utils_content = '''"""
+# common/log_utils.py
+COMMON_LOG_UTILS_PY = encode_text('''"""
 File: common/log_utils.py
 Purpose: 项目日志工具函数
 """
@@ -1872,170 +1922,486 @@ def get_logger(module_name: str, parent_logger: str = 'auto_feature') -> logging
         # 获取特定模块的logger
         logger = get_logger('processor.basic')  # 返回 auto_feature.processor.basic logger
 
-        # 获取其他应用的logger
-        logger = get_logger('api.views', 'excel_demo')  # 返回 excel_demo.api.views logger
+        # 获取其他应用的logger
+        logger = get_logger('api.views', 'excel_demo')  # 返回 excel_demo.api.views logger
+    """
+    return logging.getLogger(f'{parent_logger}.{module_name}')
+
+
+def get_app_logger(app_name: str, module_name: Optional[str] = None) -> logging.Logger:
+    """获取应用特定的logger实例
+
+    Args:
+        app_name: 应用名称 (例如 'auto_feature' 或 'excel_demo')
+        module_name: 可选的模块名称
+
+    Returns:
+        logging.Logger: 配置好的logger实例
+
+    Example:
+        # 获取应用特定模块的logger
+        logger = get_app_logger('auto_feature', 'api.views')
+
+        # 获取应用级别的logger
+        logger = get_app_logger('excel_demo')
+    """
+    if module_name:
+        return logging.getLogger(f'{app_name}.{module_name}')
+    return logging.getLogger(app_name)
+''')
+
+
+# 需要填入项目信息的文件模板，用string.Template替换$占位符，正文中的花括号无需转义
+# config/settings/base.py
+SETTINGS_BASE_PY = Template('''"""
+File: config/settings/base.py
+Purpose: Django项目基础配置文件
+Warning: 此文件包含关键项目配置，修改前请仔细评估影响
+"""
+
+from pathlib import Path
+import os
+import sys
+from .logging_config import LOGGING
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# 添加apps目录到Python路径
+sys.path.append(str(BASE_DIR))
+sys.path.append(str(BASE_DIR / 'apps'))
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'django-insecure-your-secret-key-here'
+
+# Application definition
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'rest_framework',
+    'rest_framework.authtoken',
+    'drf_yasg',  # Swagger/OpenAPI文档
+${app_configs}
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'config.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [
+${templates_dirs}
+        ],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'config.wsgi.application'
+
+# Database
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+    }
+}
+
+# Password validation
+AUTH_PASSWORD_VALIDATORS = [
+    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
+]
+
+# Internationalization
+LANGUAGE_CODE = 'zh-hans'
+TIME_ZONE = 'Asia/Shanghai'
+USE_I18N = True
+USE_TZ = True
+
+# Static files (CSS, JavaScript, Images)
+STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATICFILES_DIRS = [
+    BASE_DIR / 'static',
+]
+
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Default primary key field type
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# REST Framework配置
+REST_FRAMEWORK = {
+    'DEFAULT_PERMISSION_CLASSES': [
+        'rest_framework.permissions.AllowAny',  # 开发阶段允许所有访问
+    ],
+    # 新增认证类配置
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.TokenAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+    ],
+    'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema',
+    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'PAGE_SIZE': 10,
+}
+
+# Swagger配置
+SWAGGER_SETTINGS = {
+    'USE_SESSION_AUTH': False,  # 禁用session认证
+    'JSON_EDITOR': True,        # 启用JSON编辑器
+    'SECURITY_DEFINITIONS': {
+        'Basic': {
+            'type': 'basic'
+        },
+        'Bearer': {
+            'type': 'apiKey',
+            'name': 'Authorization',
+            'in': 'header'
+        }
+    },
+}
+''')
+
+# README.md
+README_MD = Template('''# $project_name
+
+## 项目设置
+
+1. 创建虚拟环境:
+```bash
+python -m venv venv
+source venv/bin/activate  # Linux/Mac
+venv\\Scripts\\activate  # Windows
+```
+
+2. 安装依赖:
+```bash
+pip install -r requirements/local.txt
+```
+
+3. 初始化数据库:
+```bash
+python manage.py migrate
+```
+
+4. 创建超级用户:
+```bash
+python manage.py createsuperuser
+```
+
+5. 运行开发服务器:
+```bash
+python manage.py runserver
+```
+
+## 项目结构
+
+```
+$project_name/
+├── manage.py           # Django命令行工具
+├── config/             # 项目配置
+│   ├── settings/      # 分环境配置
+│   ├── urls.py       # URL配置
+│   ├── wsgi.py      # WSGI配置
+│   └── asgi.py     # ASGI配置
+├── apps/             # 应用目录
+├── templates/        # 项目级模板
+├── static/           # 静态文件
+├── media/            # 上传文件
+├── docs/            # 文档
+│   ├── api.md                  # API接口文档
+│   ├── deployment.md           # 部署文档
+│   ├── api_design_guide.md     # API设计指南(精简版)
+│   └── django_rest_api_lightweight_specification_and_implementation_guide.md # API设计指南(完整版)
+└── requirements/     # 依赖管理
+```
+
+## 环境配置
+
+1. 开发环境:
+```bash
+export DJANGO_SETTINGS_MODULE=config.settings.local
+```
+
+2. 生产环境:
+```bash
+export DJANGO_SETTINGS_MODULE=config.settings.production
+```
+
+## 应用说明
+
+1. main: 系统主要功能模块
+2. [其他应用说明]
+
+## 开发指南
+
+### 创建新应用
+
+```bash
+python manage.py startapp your_app_name apps/your_app_name
+```
+
+### 运行测试
+
+```bash
+python manage.py test
+```
+
+### 收集静态文件
+
+```bash
+python manage.py collectstatic
+```
+
+## API文档
+
+API文档位于 `docs/api.md`
+
+## 部署指南
+
+详细部署说明请参考 `docs/deployment.md`
+
+## 开发团队
+
+[填写开发团队信息]
+
+## 许可证
+
+[选择适当的许可证]
+''')
+
+
+def create_project_structure(project_name, parent_dir=None):
+    """创建项目的完整目录结构和文件
+
+    Args:
+        project_name (str): 项目名称
+        parent_dir (Path, optional): 项目所在目录. 默认为当前目录
     """
-    return logging.getLogger(f'{parent_logger}.{module_name}')
+    if parent_dir is None:
+        parent_dir = Path.cwd()
+    base_dir = parent_dir / project_name
 
+    # 项目已初始化（manage.py已存在）时跳过所有目录和文件的创建
+    if (base_dir / 'manage.py').exists():
+        print(f"! 项目已初始化，跳过项目结构创建: {base_dir}")
+        return True
 
-def get_app_logger(app_name: str, module_name: Optional[str] = None) -> logging.Logger:
-    """获取应用特定的logger实例
+    # INSTALLED_APPS和urlpatterns中的应用条目由INITIAL_APPS一次性渲染
+    app_configs, url_lines = render_app_registrations(INITIAL_APPS)
 
-    Args:
-        app_name: 应用名称 (例如 'auto_feature' 或 'excel_demo')
-        module_name: 可选的模块名称
+    # 创建项目根目录，并得知它是否为本次新建
+    try:
+        base_dir.mkdir(parents=True)
+        log(f"? 创建目录: {base_dir}")
+        is_new_project_dir = True
+    except FileExistsError:
+        is_new_project_dir = False
+    except Exception as e:
+        log(f"? 创建目录失败 {base_dir}: {str(e)}")
+        flush_log()
+        return False
 
-    Returns:
-        logging.Logger: 配置好的logger实例
+    # 以下所有路径都基于base_dir构建，不切换进程工作目录
+    # 创建基本目录结构
+    directories = [
+        'config/settings',
+        'apps',
+        'static/css',
+        'static/js',
+        'static/images',
+        'templates/shared',
+        'media/uploads',
+        'docs',
+        'common',
+        'requirements',
+    ]
 
-    Example:
-        # 获取应用特定模块的logger
-        logger = get_app_logger('auto_feature', 'api.views')
+    # 一次性创建目录（新建的项目目录下无需逐级检查），再添加__init__.py
+    project_dirs = [base_dir / directory for directory in directories]
+    if is_new_project_dir:
+        create_directory_tree(base_dir, project_dirs)
+    else:
+        create_directories(project_dirs)
+    for directory in PROJECT_PACKAGE_DIRS:
+        create_file(base_dir / directory / '__init__.py',
+                    file_header(f'{directory}/__init__.py', f'{directory}包的初始化文件'))
 
-        # 获取应用级别的logger
-        logger = get_app_logger('excel_demo')
-    """
-    if module_name:
-        return logging.getLogger(f'{app_name}.{module_name}')
-    return logging.getLogger(app_name)
-'''
+    # 构建模板目录列表
+    templates_dirs = ["            BASE_DIR / 'templates'"]
+    templates_dirs.extend(f"            BASE_DIR / 'apps' / '{app}' / 'templates'" for app in INITIAL_APPS)
+    templates_str = ',\n'.join(templates_dirs)
+    # INSTALLED_APPS中的应用条目，模板渲染前拼接好
+    app_configs_str = '\n'.join(app_configs)
+
+    # 开头、各应用URL和结尾部分一次拼接
+    urls_py = ''.join((URLS_PY_HEAD, *url_lines, URLS_PY_TAIL))
 
     app_loggers = '\n'.join(get_app_logger_config(app) for app in INITIAL_APPS)
-    logging_config = get_logging_config_template().format(app_loggers=app_loggers)
+    logging_config = LOGGING_CONFIG_PY.substitute(app_loggers=app_loggers)
 
     # 创建配置文件
     files_to_create = {
-        'config/settings/base.py': settings_base,
-        'config/settings/local.py': settings_local,
-        'config/settings/production.py': settings_production,
+        'config/settings/base.py': SETTINGS_BASE_PY.substitute(app_configs=app_configs_str, templates_dirs=templates_str),
+        'config/settings/local.py': SETTINGS_LOCAL_PY,
+        'config/settings/production.py': SETTINGS_PRODUCTION_PY,
         'config/settings/logging_config.py': logging_config,
-        'config/wsgi.py': wsgi_py,
-        'config/asgi.py': asgi_py,
+        'config/wsgi.py': WSGI_PY,
+        'config/asgi.py': ASGI_PY,
         'config/urls.py': urls_py,
-        'manage.py': manage_py,
-        'requirements/base.txt': requirements_base,
-        'requirements/local.txt': requirements_local,
-        'requirements/production.txt': requirements_production,
-        '.gitignore': gitignore,
-        '.env': env,
-        'README.md': readme,
-        'docs/api.md': api_md,
-        'docs/deployment.md': deployment_md,
+        'manage.py': MANAGE_PY,
+        'requirements/base.txt': REQUIREMENTS_BASE,
+        'requirements/local.txt': REQUIREMENTS_LOCAL,
+        'requirements/production.txt': REQUIREMENTS_PRODUCTION,
+        '.gitignore': GITIGNORE,
+        '.env': ENV_FILE,
+        'README.md': README_MD.substitute(project_name=project_name),
+        'docs/api.md': API_MD,
+        'docs/deployment.md': DEPLOYMENT_MD,
         'docs/api_design_guide.md': get_api_design_guide_simple(),  # 添加精简版指南
         'docs/django_rest_api_lightweight_specification_and_implementation_guide.md': get_django_rest_api_lightweight_specification_and_implementation_guide(),  # 添加完整版指南
-        'common/helpers.py': common_helpers,
-        'common/log_utils.py': common_utils_content,
-        'templates/base.html': base_html,
-        'templates/shared/header.html': shared_header,
-        'templates/shared/footer.html': shared_footer,
+        'common/helpers.py': COMMON_HELPERS_PY,
+        'common/log_utils.py': COMMON_LOG_UTILS_PY,
+        'templates/base.html': BASE_HTML,
+        'templates/shared/header.html': SHARED_HEADER_HTML,
+        'templates/shared/footer.html': SHARED_FOOTER_HTML,
     }
 
-    # 创建所有配置文件
-    success = True
-    for file_path, content in files_to_create.items():
+    # 创建所有配置文件：各文件相互独立，使用线程池并行写入
+    def create_project_file(item):
+        """创建单个项目文件，返回(是否成功, 该文件产生的日志)"""
+        file_path, content = item
+        ok = True
         try:
-            # 如果文件已存在，记录但不视为错误
-            if os.path.exists(Path(file_path)):
-                print(f"! 文件已存在: {file_path}")
-                continue
-
-            # 创建文件，但如果失败不会立即退出
-            if not create_file(Path(file_path), content):
-                success = False
-                print(f"× 创建文件失败: {file_path}")
+            # 创建文件，但如果失败不会立即退出；create_file独占创建，
+            # 文件已存在时记录但不视为错误，无需事先检查
+            if not create_file(base_dir / file_path, content):
+                ok = False
+                log(f"× 创建文件失败: {file_path}")
         except Exception as e:
-            success = False
-            print(f"× 创建文件出错 {file_path}: {str(e)}")
+            ok = False
+            log(f"× 创建文件出错 {file_path}: {str(e)}")
+        return ok, take_log()
+
+    success = True
+    with ThreadPoolExecutor(max_workers=MAX_FILE_WORKERS) as executor:
+        # 按files_to_create的顺序收集各文件的日志，输出顺序与串行创建时一致
+        for ok, messages in executor.map(create_project_file, files_to_create.items()):
+            success = success and ok
+            for message in messages:
+                log(message)
 
     # 尝试设置manage.py为可执行
     try:
-        os.chmod('manage.py', 0o755)
+        os.chmod(base_dir / 'manage.py', 0o755)
     except Exception as e:
-        print(f"! 设置manage.py权限失败: {str(e)}")
+        log(f"! 设置manage.py权限失败: {str(e)}")
         # 不将权限设置失败视为严重错误
+    flush_log()
 
     # 创建初始应用
-    for app_name in INITIAL_APPS:
-        create_app_structure(app_name, project_name, Path.cwd())
-
-        # 添加URL配置
-        with open('config/urls.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if f"path('{app_name}/'," not in content:
-            url_pattern = f"    path('{app_name}/', include('{app_name}.urls')),"
-            content = content.replace(
-                "urlpatterns = [",
-                f"urlpatterns = [\n{url_pattern}"
-            )
-            create_file('config/urls.py', content)
-
-    print("\n? Django项目初始化完成！")
-    print("\n?? 后续步骤：")
-    print("1. 创建并激活虚拟环境")
-    print("2. 安装依赖: pip install -r requirements/local.txt")
-    print("3. 初始化数据库: python manage.py migrate")
-    print("4. 创建超级用户: python manage.py createsuperuser")
-    print("5. 运行开发服务器: python manage.py runserver")
+    # 各初始应用的URL已写入上面的urls_py模板，这里不再逐个回读改写
+    create_app_structures(INITIAL_APPS, project_name, base_dir)
+
+    # 后续步骤提示缓冲后一次写出
+    log("\n? Django项目初始化完成！")
+    log("\n?? 后续步骤：")
+    log("1. 创建并激活虚拟环境")
+    log("2. 安装依赖: pip install -r requirements/local.txt")
+    log("3. 初始化数据库: python manage.py migrate")
+    log("4. 创建超级用户: python manage.py createsuperuser")
+    log("5. 运行开发服务器: python manage.py runserver")
+    flush_log()
 
     return True
 
 
 def add_app_logger_config(app_name, project_dir='.'):
-    """为新应用添加日志配置"""
+    """为新应用添加日志配置
+
+    app_name可以是单个应用名或应用名列表；传入列表时所有应用的配置一次插入，
+    logging_config.py只读写、备份一次。所有应用都添加成功时返回True。
+    """
     logging_config_path = os.path.join(project_dir, 'config', 'settings', 'logging_config.py')
 
     try:
-        with open(logging_config_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_text_file(logging_config_path)
 
-        # 检查应用日志配置是否已存在
-        if f"'{app_name}': {{" in content:
+        # 检查应用日志配置是否已存在，已存在的应用跳过
+        app_names = [app_name] if isinstance(app_name, str) else list(app_name)
+        new_loggers = [get_app_logger_config(name) for name in app_names
+                       if f"'{name}': {{" not in content]
+        if not new_loggers:
             return False
 
-        # 在LOGGING字典的loggers部分末尾添加新配置
-        new_logger = get_app_logger_config(app_name)
-        content = content.replace(
-            '    }\n}',
-            f'{new_logger}\n    }}\n}}'
-        )
+        # 在LOGGING字典的loggers部分末尾添加新配置：文件最后一个"}"关闭LOGGING，
+        # 它之前的一个"}"关闭loggers，新配置插在该行之前（模板缩进为3个空格，不按固定缩进匹配）
+        logging_close = content.rstrip().rfind('}')
+        loggers_close = content.rfind('}', 0, logging_close) if logging_close != -1 else -1
+        if loggers_close == -1:
+            print(f"! 未找到日志配置的loggers部分: {logging_config_path}")
+            return False
+        line_start = get_line_bounds(content, loggers_close)[0]
+        new_logger = '\n'.join(new_loggers)
+        new_content = f"{content[:line_start]}{new_logger}\n{content[line_start:]}"
 
-        # 创建备份
+        # 创建备份（保存修改前的内容）
         backup_dir = os.path.join(project_dir, 'config', 'app_append_backups', 'logging_backups')
         os.makedirs(backup_dir, exist_ok=True)
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = os.path.join(backup_dir, f'logging_config.py.{timestamp}.bak')
 
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_text_file(backup_path, content)
 
         # 写入更新后的配置
-        with open(logging_config_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        replace_text_file(logging_config_path, new_content)
 
-        return True
+        return len(new_loggers) == len(app_names)
     except Exception as e:
         print(f"! 更新日志配置失败: {str(e)}")
         return False
 
-def initialize_django_project(project_name):
+def initialize_django_project(project_name, parent_dir=None):
     """初始化Django项目"""
     try:
-        # 创建项目目录结构
-        create_project_structure(project_name)
+        if parent_dir is None:
+            parent_dir = Path.cwd()
+        project_dir = parent_dir / project_name
 
-        # 即使某些文件已存在，也继续创建应用
-        # 创建初始应用
-        for app_name in INITIAL_APPS:
-            create_app_structure(app_name, project_name, Path.cwd())
+        # 创建项目目录结构；base.py和urls.py直接按INITIAL_APPS渲染，
+        # 初始应用也由create_project_structure创建，无需再逐个编辑配置文件
+        create_project_structure(project_name, parent_dir)
 
-            # 使用新的辅助函数更新配置
-            try:
-                update_installed_apps(app_name)
-                update_urls_config(app_name)
-            except Exception as e:
-                print(f"配置文件更新失败: {str(e)}")
-                # 继续执行，不中断流程
+        # 后续步骤使用相对于项目根目录的路径
+        os.chdir(project_dir)
 
         print(f"\n✓ 项目 {project_name} 创建成功!")
         return True
@@ -2064,8 +2430,12 @@ def generate_manual_config_guide(app_name, project_name, base_dir, auto_updated=
             url_import_valid = True
             break
 
+    app_ref = get_app_config_ref(app_name)
+
+    # 指南内容分段收集，最后一次性拼接，避免字符串反复+=拷贝
+    guide_parts = []
     if auto_updated:
-        guide_content = f'''# {app_name} 应用配置指南
+        guide_parts.append(f'''# {app_name} 应用配置指南
 
 ## 1. 自动更新执行结果
 
@@ -2082,7 +2452,7 @@ INSTALLED_APPS = [
     'rest_framework',
     ...
     # 自定义应用
-    '{app_name}.apps.{app_name.title()}Config',  # 新增应用配置
+    '{app_ref}',  # 新增应用配置
 ]
 ```
 
@@ -2111,9 +2481,9 @@ update_main_urls('{app_name}', restore=True)      # 恢复URL配置
 """
 验证结果:
 """
-'''
+''')
     else:
-        guide_content = f'''# {app_name} 应用配置指南
+        guide_parts.append(f'''# {app_name} 应用配置指南
 
 ## 1. 配置文件位置及修改内容
 
@@ -2131,22 +2501,22 @@ INSTALLED_APPS = [
     'rest_framework',
     ...
     # 自定义应用
-    '{app_name}.apps.{app_name.title()}Config',
+    '{app_ref}',
 ]
 ```
 
 ### 1.2 配置URL路由
-文件位置: ./config/urls.py\n'''
+文件位置: ./config/urls.py\n''')
 
         if not url_import_valid:
-            guide_content += '''
+            guide_parts.append('''
 1️⃣ 检查导入语句(如果已存在则跳过):
 ```python
 from django.urls import path, include
 ```
-'''
+''')
 
-        guide_content += f'''
+        guide_parts.append(f'''
 2️⃣ 在 urlpatterns 列表中添加:
 ```python
 urlpatterns = [
@@ -2159,18 +2529,18 @@ urlpatterns = [
 """
 验证结果:
 """
-'''
+''')
 
     # 执行验证并添加结果到指南中
     for filename, is_valid, message in verification_results:
-        guide_content += f'''
+        guide_parts.append(f'''
 {filename}:
 状态: {'✅' if is_valid else '❌'} {message}
 路径: ./apps/{app_name}/{filename}
-'''
+''')
 
     if auto_updated:
-        guide_content += f'''
+        guide_parts.append(f'''
 
 ## 2. 后续步骤
 
@@ -2192,9 +2562,9 @@ urlpatterns = [
    - 根据需要添加其他URL配置
 
 如果需要手动修改配置，请参考以下说明。
-'''
+''')
     else:
-        guide_content += f'''
+        guide_parts.append(f'''
 
 如果看到❌标记，请检查对应文件是否被修改过。
 自动创建的文件应该保持原样，除非你明确知道要修改什么。
@@ -2208,9 +2578,9 @@ urlpatterns = [
 ✅ 已确认视图函数工作正常
 ✅ 已确认模板文件位置正确
 ✅ 已测试页面能正常访问
-'''
+''')
 
-    guide_content += f'''
+    guide_parts.append(f'''
 ## 3. 验证步骤
 
 1. 检查项目配置:
@@ -2276,12 +2646,11 @@ python manage.py migrate {app_name}
 - 使用 django-debug-toolbar 查看请求信息
 - 在视图中添加 print() 或使用 logging 模块
 - 检查开发服务器的控制台输出
-'''
+''')
 
     guide_file = base_dir / 'apps' / app_name / 'CONFIG_GUIDE.md'
     try:
-        with open(guide_file, 'w', encoding='utf-8') as f:
-            f.write(guide_content)
+        write_text_file(guide_file, ''.join(guide_parts))
         print(f"\n✓ 配置指南已生成: {guide_file}")
         if auto_updated:
             print("  配置已自动更新，请查看该文件了解更新详情")
@@ -2290,59 +2659,65 @@ python manage.py migrate {app_name}
     except Exception as e:
         print(f"\n✗ 配置指南生成失败: {str(e)}")
 
-def update_installed_apps(app_name):
-    try:
-        with open('config/settings/base.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if f"'{app_name}'" not in content:
-            lines = content.split('\n')
-            insert_pos = -1
-            for i, line in enumerate(lines):
-                if 'INSTALLED_APPS = [' in line:
-                    insert_pos = i + 1
-                    while i < len(lines) and ('django.contrib' in lines[i] or 'rest_framework' in lines[i]):
-                        i += 1
-                        insert_pos = i + 1
-
-            if insert_pos != -1:
-                lines.insert(insert_pos, f"    '{app_name}.apps.{app_name.title()}Config',")
-                content = '\n'.join(lines)
-                return create_file('config/settings/base.py', content)  # 使用create_file的返回值
-            return False  # 找不到插入位置
-        return True  # 应用已存在也算成功
-    except Exception as e:
-        print(f"! 更新INSTALLED_APPS失败: {str(e)}")
-        return False
 
+# 配置文件定位用的预编译正则，按原字符串直接拼接，不再整体split/join
+_INSTALLED_APPS_START_RE = re.compile(r'^[ \t]*INSTALLED_APPS[^\n]*\[', re.M)
+_URLPATTERNS_START_RE = re.compile(r'^[ \t]*urlpatterns[^\n[]*\[', re.M)
+_DJANGO_URLS_IMPORT_RE = re.compile(r'^.*from django\.urls import.*$', re.M)
+_TOP_IMPORT_RE = re.compile(r'^from (?:django\.|rest_framework)', re.M)
+_FIRST_INDENT_RE = re.compile(r'^([ \t]*)[^\s#]', re.M)
+# 匹配括号时需要整体跳过的注释和单行字符串，以及方括号本身
+_BRACKET_TOKEN_RE = re.compile(r'''#[^\n]*|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|[\[\]]''')
 
-def update_urls_config(app_name):
-    """更新URL配置"""
-    try:
-        with open('config/urls.py', 'r', encoding='utf-8') as f:
-            content = f.read()
+# 列表中还没有任何条目时使用的缩进（PEP 8）
+DEFAULT_INDENT = '    '
 
-        if f"path('{app_name}/'," not in content:
-            # 主应用作为根URL
-            if app_name == 'main':
-                url_pattern = f"    path('', include('main.urls')),  # 主应用作为根URL\n"
-            else:
-                url_pattern = f"    path('{app_name}/', include('{app_name}.urls')),\n"
 
-            # 在最后一个path之前插入
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if ']' in line and 'urlpatterns' in content[:i]:
-                    lines.insert(i, url_pattern)
-                    break
-            new_content = '\n'.join(lines)
+def get_line_bounds(content, pos):
+    """返回pos所在行的(行首, 行尾)偏移，行尾不含换行符"""
+    line_start = content.rfind('\n', 0, pos) + 1
+    line_end = content.find('\n', pos)
+    if line_end == -1:
+        line_end = len(content)
+    return line_start, line_end
 
-            # 直接写入文件而不是使用create_file
-            with open('config/urls.py', 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f"✓ 已添加 {app_name} 的URL配置")
-    except Exception as e:
-        print(f"! 更新URL配置失败: {str(e)}")
+
+def find_closing_bracket(content, open_pos):
+    """返回与open_pos处"["配对的"]"的偏移，找不到时返回-1
+
+    按方括号深度计数，跳过注释和字符串中的括号，嵌套列表和同一行中的
+    "] + debug_toolbar_urls()" 等写法都能定位到真正的结束位置。
+    """
+    depth = 0
+    for token in _BRACKET_TOKEN_RE.finditer(content, open_pos):
+        bracket = token.group(0)
+        if bracket == '[':
+            depth += 1
+        elif bracket == ']':
+            depth -= 1
+            if depth == 0:
+                return token.start()
+    return -1
+
+
+@functools.lru_cache(maxsize=256)
+def get_duplicate_url_re(app_name):
+    """返回匹配应用已有URL配置行的正则（按应用名缓存）
+
+    命中含有path('<app>/'、path("<app>/"、include('<app>.urls')或include("<app>.urls")
+    的非注释行（引号需成对，与逐个子串检查的结果一致），group(1)为该行去掉缩进后的内容。
+    """
+    name = re.escape(app_name)
+    return re.compile(
+        rf"""^[ \t]*(?=[^\s#])([^\n]*?(?:path\((?P<q1>['"]){name}/(?P=q1)"""
+        rf"""|include\((?P<q2>['"]){name}\.urls(?P=q2)\))[^\n]*)""",
+        re.M)
+
+
+def detect_indent(block):
+    """返回列表块中第一个有效行的缩进，块中没有有效行时返回DEFAULT_INDENT"""
+    match = _FIRST_INDENT_RE.search(block)
+    return match.group(1) if match else DEFAULT_INDENT
 
 
 def get_backup_paths(project_dir='.'):
@@ -2357,8 +2732,6 @@ def get_backup_paths(project_dir='.'):
             - base_backup_dir: INSTALLED_APPS配置备份目录
             - urls_backup_dir: URLs配置备份目录
     """
-    from pathlib import Path
-
     # 主备份目录
     backup_root = Path(project_dir) / 'config' / 'app_append_backups'
 
@@ -2372,6 +2745,38 @@ def get_backup_paths(project_dir='.'):
 
     return str(base_backup_dir), str(urls_backup_dir)
 
+
+def get_latest_backup_file(backup_dir, prefix):
+    """返回备份目录中最新的备份文件路径，没有备份时返回None
+
+    备份文件名带时间戳，按文件名取最大值即为最新；单次scandir遍历，无需整体排序。
+    """
+    try:
+        with os.scandir(backup_dir) as entries:
+            latest = max((entry.name for entry in entries
+                          if entry.name.startswith(prefix) and entry.name.endswith('.bak')),
+                         default=None)
+    except FileNotFoundError:
+        return None
+    return f'{backup_dir}/{latest}' if latest else None
+
+
+def find_identical_backup(backup_dir, prefix, data):
+    """最新备份与data（文件原始字节）完全相同时返回该备份路径，否则返回None
+
+    先比较文件大小，大小一致时才读取内容比较；反复更新同一文件时据此跳过重复备份。
+    """
+    latest = get_latest_backup_file(backup_dir, prefix)
+    if latest is None:
+        return None
+    try:
+        if os.path.getsize(latest) != len(data) or Path(latest).read_bytes() != data:
+            return None
+    except OSError:
+        return None
+    return latest
+
+
 def validate_base_settings_content(content):
     """验证base settings文件的基本格式"""
     if not content.strip():
@@ -2381,28 +2786,16 @@ def validate_base_settings_content(content):
     return True, ""
 
 
-def validate_base_settings_syntax(content):
-    """验证base settings文件的Python语法"""
-    try:
-        compile(content, '<string>', 'exec')
-        return True, ""
-    except SyntaxError as e:
-        return False, str(e)
-
-
 def validate_base_settings_result(new_content):
     """验证base settings文件修改后的内容"""
+    import ast
     try:
         # 1. 检查基本结构
         if 'INSTALLED_APPS' not in new_content:
             return False, "INSTALLED_APPS lost after modification"
 
-        # 2. 检查语法
-        compile(new_content, '<string>', 'exec')
-
-        # 3. 检查格式
-        if new_content.count('[') != new_content.count(']'):
-            return False, "Bracket mismatch"
+        # 2. 检查语法（语法解析通过即保证括号配对，无需再单独计数）
+        ast.parse(new_content)
 
         return True, ""
     except Exception as e:
@@ -2425,56 +2818,40 @@ def append_app_to_base_settings(content, app_name):
     if not valid:
         return content, False, f"Pre-validation failed: {msg}"
 
-    valid, msg = validate_base_settings_syntax(content)
-    if not valid:
-        return content, False, f"Syntax validation failed: {msg}"
+    # 语法检查只在修改后做一次：原文件有语法错误时，插入一行后同样无法通过
 
     # 2. 处理文件内容
     try:
-        lines = content.split('\n')
-
         # 2.1 定位 INSTALLED_APPS
-        start_index = -1
-        end_index = -1
-        for i, line in enumerate(lines):
-            line_content = line.strip()
-            if line_content.startswith('INSTALLED_APPS') and '[' in line:
-                start_index = i
-            if start_index != -1 and ']' in line:
-                end_index = i
-                break
-
-        if start_index == -1 or end_index == -1:
+        match = _INSTALLED_APPS_START_RE.search(content)
+        close_pos = content.find(']', match.start()) if match else -1
+        if close_pos == -1:
             return content, False, "INSTALLED_APPS not found or invalid format"
+        block_start = get_line_bounds(content, match.start())[1] + 1
+        end_start = get_line_bounds(content, close_pos)[0]
 
         # 2.2 分析现有格式
-        existing_lines = lines[start_index + 1:end_index]
-        indent = ''
-        for line in existing_lines:
-            if line.strip() and not line.strip().startswith('#'):
-                indent = line[:-len(line.lstrip())]
-                break
+        block = content[block_start:end_start] if end_start > block_start else ''
+        indent = detect_indent(block)
 
         if not indent:
             return content, False, "Cannot determine indentation"
 
-        # 2.3 检查是否已存在
-        app_patterns = [
-            f"{app_name}.apps.{app_name.title()}Config",
-            app_name
-        ]
-        for line in existing_lines:
-            line = line.strip()
-            if line.startswith('#'):
-                continue
-            for pattern in app_patterns:
-                if f"'{pattern}'" in line or f'"{pattern}"' in line:
+        # 2.3 检查是否已存在：先在整个块中查找，只有命中时才逐行排除注释行
+        app_ref = get_app_config_ref(app_name)
+        quoted_patterns = [f"{quote}{pattern}{quote}"
+                           for pattern in (app_ref, app_name) for quote in ("'", '"')]
+        if any(pattern in block for pattern in quoted_patterns):
+            for line in block.splitlines():
+                line = line.strip()
+                if line.startswith('#'):
+                    continue
+                if any(pattern in line for pattern in quoted_patterns):
                     return content, False, f"App {app_name} already exists in line: {line}"
 
         # 2.4 插入新配置
-        app_config = f"{indent}'{app_name}.apps.{app_name.title()}Config',"
-        lines.insert(end_index, app_config)
-        new_content = '\n'.join(lines)
+        app_config = f"{indent}'{app_ref}',"
+        new_content = f"{content[:end_start]}{app_config}\n{content[end_start:]}"
 
         # 2.5 验证结果
         valid, msg = validate_base_settings_result(new_content)
@@ -2502,56 +2879,53 @@ def update_base_settings(app_name, restore=False):
     更新算法：
         1. 文件定位：读取 config/settings/base.py 文件
         2. 内容提取：
-           - 将文件按行分割为列表
-           - 查找 "INSTALLED_APPS = [" 所在行
-           - 向后扫描直到找到对应的结束符号 "]"
+           - 用预编译正则在原字符串中定位 "INSTALLED_APPS = [" 所在行
+           - 向后查找对应的结束符号 "]"
         3. 注入规则：
            - 检查是否已存在 '{app_name}.apps.{app_name.title()}Config'
            - 如果不存在，在最后一个应用配置后、结束符号"]"前插入新应用配置
            - 新应用配置格式: '    '{app_name}.apps.{app_name.title()}Config','
            - 保持4空格缩进以维持代码格式
         4. 保存机制：
-           - 将修改后的行列表重新连接为字符串
-           - 使用 'w' 模式写回原文件
-           - 写入失败时自动回滚到备份版本
+           - 在结束符号所在行之前直接拼接新配置行
+           - 先写入临时文件，再用 os.replace 原子替换原文件
+           - 写入失败时原文件保持不变
 
     参数：
-        app_name (str): 要添加到 INSTALLED_APPS 的应用名称
+        app_name (str | list): 要添加到 INSTALLED_APPS 的应用名称；传入列表时
+            所有应用共用一次备份，并只读写一次文件
         restore (bool): 是否执行恢复操作
             - True: 从最新备份恢复
             - False: 创建新备份并执行更新（默认）
 
     返回：
-        bool: 操作成功返回 True，失败返回 False
+        bool: 所有应用都添加成功返回 True，否则返回 False
 
     用法示例：
         # 添加新应用
         update_base_settings('myapp')
 
+        # 一次添加多个应用
+        update_base_settings(['blog', 'shop'])
+
         # 恢复到最新备份
         update_base_settings('myapp', restore=True)
     """
-    from datetime import datetime
     settings_path = 'config/settings/base.py'
     base_backup_dir, _ = get_backup_paths()
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_path = f'{base_backup_dir}/base.py.{timestamp}.bak'
 
     # 获取最新的备份文件
     def get_latest_backup():
-        if os.path.exists(base_backup_dir):
-            backups = sorted([f for f in os.listdir(base_backup_dir)
-                              if f.startswith('base.py.') and f.endswith('.bak')],
-                             reverse=True)
-            return f'{base_backup_dir}/{backups[0]}' if backups else None
-        return None
+        return get_latest_backup_file(base_backup_dir, 'base.py.')
 
     # 处理恢复操作
     if restore:
         latest_backup = get_latest_backup()
         if latest_backup:
             try:
-                shutil.copy2(latest_backup, settings_path)
+                replace_text_file(settings_path, read_text_file(latest_backup))
                 print(f"? 已恢复INSTALLED_APPS配置文件至备份: {latest_backup}")
                 return True
             except Exception as e:
@@ -2562,38 +2936,48 @@ def update_base_settings(app_name, restore=False):
             return False
 
     try:
-        # 1. 创建新的备份
-        if os.path.exists(settings_path):
-            shutil.copy2(settings_path, backup_path)
-            print(f"\n# 备份信息:")
+        # 1. 读取文件并创建新的备份
+        original = Path(settings_path).read_bytes()
+        print(f"\n# 备份信息:")
+        identical_backup = find_identical_backup(base_backup_dir, 'base.py.', original)
+        if identical_backup:
+            # 内容未变化时沿用最新备份，恢复结果相同
+            print(f"√ 配置文件与最新备份相同，沿用备份: {identical_backup}")
+        else:
+            # 直接写出已读取的原始字节，与urls.py的备份方式一致
+            Path(backup_path).write_bytes(original)
             print(f"√ 已创建配置文件备份: {backup_path}")
-            print(f"! 备份目录位置: {base_backup_dir}")
-            print(f"  如果确认配置正确，可以手动删除备份目录: {base_backup_dir}")
-
-        # 2. 读取文件
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 3. 处理内容
-        new_content, has_update, app_config = append_app_to_base_settings(content, app_name)
-
-        if has_update:
+        print(f"! 备份目录位置: {base_backup_dir}")
+        print(f"  如果确认配置正确，可以手动删除备份目录: {base_backup_dir}")
+
+        # 2. 解码文件内容
+        content = decode_text(original)
+
+        # 3. 处理内容：多个应用依次在内存中追加，最后只写一次
+        app_names = [app_name] if isinstance(app_name, str) else list(app_name)
+        new_content = content
+        added_configs = []
+        for name in app_names:
+            new_content, has_update, app_config = append_app_to_base_settings(new_content, name)
+            if has_update:
+                added_configs.append(app_config)
+
+        if added_configs:
             print(f"\n# 更新信息:")
-            print(f"→ 在INSTALLED_APPS中添加: {app_config}")
+            for app_config in added_configs:
+                print(f"→ 在INSTALLED_APPS中添加: {app_config}")
 
             # 4. 写入更新后的内容
             try:
-                with open(settings_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                replace_text_file(settings_path, new_content)
                 print(f"? 更新INSTALLED_APPS成功")
                 print(f"\n# 恢复说明:")
-                print(f"  如需恢复，请使用: update_base_settings('{app_name}', restore=True)")
-                return True
+                print(f"  如需恢复，请使用: update_base_settings({app_name!r}, restore=True)")
+                return len(added_configs) == len(app_names)
             except Exception as write_err:
                 print(f"× 写入更新失败: {str(write_err)}")
-                # 5. 如果写入失败，恢复备份
-                shutil.copy2(backup_path, settings_path)
-                print("! 已自动恢复至备份状态")
+                # 5. 原子替换失败时原文件保持不变，无需恢复
+                print("! 原配置文件未被修改")
                 raise write_err
         return False
 
@@ -2602,7 +2986,7 @@ def update_base_settings(app_name, restore=False):
         # 6. 发生任何错误，确保恢复备份
         latest_backup = get_latest_backup()
         if latest_backup:
-            shutil.copy2(latest_backup, settings_path)
+            replace_text_file(settings_path, read_text_file(latest_backup))
             print("! 已自动恢复至备份状态")
         return False
 
@@ -2611,175 +2995,154 @@ def append_url_to_main_urls(content, app_name):
     """
     向Django主urls配置文件中添加新的URL配置
     """
-    print("\n=== URLs更新详细信息 ===")
+    debug("\n=== URLs更新详细信息 ===")
 
     # 1. 预检查
-    print("\n# 1. 预验证检查")
+    debug("\n# 1. 预验证检查")
     valid, msg = validate_main_urls_content(content)
     if not valid:
         print(f"× 内容预验证失败: {msg}")
         return content, False, f"Pre-validation failed: {msg}"
-    print("√ 内容预验证通过")
+    debug("√ 内容预验证通过")
 
-    valid, msg = validate_main_urls_syntax(content)
-    if not valid:
-        print(f"× 语法预验证失败: {msg}")
-        return content, False, f"Syntax validation failed: {msg}"
-    print("√ 语法预验证通过")
+    # 语法检查只在修改后做一次：原文件有语法错误时，插入一行后同样无法通过
 
     # 2. 处理文件内容
     try:
-        print("\n# 2. 文件内容处理")
-        lines = content.split('\n')
-        print(f"→ 总行数: {len(lines)}")
+        debug("\n# 2. 文件内容处理")
+        original = content
+        line_count = content.count('\n') + 1
+        debug(f"→ 总行数: {line_count}")
 
         # 新增：确保必要的导入存在
-        print("\n# 2.0 检查并添加必要的导入")
+        debug("\n# 2.0 检查并添加必要的导入")
         has_include_import = False
-        for line in lines:
-            if 'from django.urls import' in line:
-                if 'include' in line:
-                    has_include_import = True
-                    print("√ 已存在include导入")
-                elif 'path' in line:
-                    # 在现有的path导入中添加include
-                    lines[lines.index(line)] = line.replace('import path', 'import path, include')
-                    has_include_import = True
-                    print("√ 在现有path导入中添加include")
-                    break
+        for match in _DJANGO_URLS_IMPORT_RE.finditer(content):
+            line = match.group(0)
+            if 'include' in line:
+                has_include_import = True
+                debug("√ 已存在include导入")
+            elif 'path' in line:
+                # 在现有的path导入中添加include
+                content = (content[:match.start()]
+                           + line.replace('import path', 'import path, include')
+                           + content[match.end():])
+                has_include_import = True
+                debug("√ 在现有path导入中添加include")
+                break
 
         if not has_include_import:
             # 在顶部导入区域添加新的导入语句
-            for i, line in enumerate(lines):
-                if line.startswith('from django.') or line.startswith('from rest_framework'):
-                    lines.insert(i, 'from django.urls import path, include')
-                    print("√ 添加新的导入语句")
-                    break
+            match = _TOP_IMPORT_RE.search(content)
+            if match:
+                content = f"{content[:match.start()]}from django.urls import path, include\n{content[match.start():]}"
+                debug("√ 添加新的导入语句")
 
         # 2.1 定位 urlpatterns
-        print("\n# 2.1 定位urlpatterns")
-        start_index = -1
-        end_index = -1
-        for i, line in enumerate(lines):
-            line_content = line.strip()
-            if line_content.startswith('urlpatterns') and '[' in line:
-                start_index = i
-                print(f"√ 找到urlpatterns起始位置: 第{i + 1}行")
-            if start_index != -1 and ']' in line and 'debug_toolbar' not in line:
-                end_index = i
-                print(f"√ 找到urlpatterns结束位置: 第{i + 1}行")
-                break
+        debug("\n# 2.1 定位urlpatterns")
+        start_index = end_index = -1
+        end_start = -1
+        match = _URLPATTERNS_START_RE.search(content)
+        if match:
+            start_index = content.count('\n', 0, match.start())
+            debug(f"√ 找到urlpatterns起始位置: 第{start_index + 1}行")
+            # 按括号配对定位结束位置，嵌套列表和注释、字符串中的括号不会误判
+            close_pos = find_closing_bracket(content, match.end() - 1)
+            if close_pos != -1:
+                end_start = get_line_bounds(content, close_pos)[0]
+                end_index = content.count('\n', 0, end_start)
+                debug(f"√ 找到urlpatterns结束位置: 第{end_index + 1}行")
 
         if start_index == -1 or end_index == -1:
             print("× 无法定位urlpatterns的完整范围")
-            return content, False, "urlpatterns not found or invalid format"
-        print(f"√ urlpatterns范围确定: 第{start_index + 1}行 到 第{end_index + 1}行")
+            return original, False, "urlpatterns not found or invalid format"
+        debug(f"√ urlpatterns范围确定: 第{start_index + 1}行 到 第{end_index + 1}行")
 
         # 2.2 分析现有格式
-        print("\n# 2.2 分析现有格式")
-        existing_lines = lines[start_index + 1:end_index]
-        print(f"→ urlpatterns中现有内容行数: {len(existing_lines)}")
-
-        indent = ''
-        for line in existing_lines:
-            if line.strip() and not line.strip().startswith('#'):
-                indent = line[:-len(line.lstrip())]
-                print(f"√ 检测到缩进: {len(indent)}个空格")
-                break
+        debug("\n# 2.2 分析现有格式")
+        block_start = get_line_bounds(content, match.start())[1] + 1
+        block = content[block_start:end_start] if end_start > block_start else ''
+        # 块以结束括号所在行的行首为界，每行都以换行符结尾
+        block_line_count = block.count('\n')
+        debug(f"→ urlpatterns中现有内容行数: {block_line_count}")
+
+        indent = detect_indent(block)
+        if indent:
+            debug(f"√ 检测到缩进: {len(indent)}个空格")
 
         if not indent:
             print("× 无法确定缩进格式")
-            return content, False, "Cannot determine indentation"
+            return original, False, "Cannot determine indentation"
 
         # 2.3 检查是否已存在
-        print("\n# 2.3 检查URL配置是否已存在")
-        pattern_checks = [
-            f"path('{app_name}/'",  # 标准格式
-            f'path("{app_name}/"',  # 双引号格式
-            f"include('{app_name}.urls')",  # include 检查
-            f'include("{app_name}.urls")',  # include 双引号检查
-        ]
-        for line in existing_lines:
-            line = line.strip()
-            if line.startswith('#'):
-                continue
-            for pattern in pattern_checks:
-                if pattern in line:
-                    print(f"! 发现已存在的URL配置: {line}")
-                    return content, False, f"URL pattern for {app_name} already exists in line: {line}"
-        print("√ 未发现重复的URL配置")
+        debug("\n# 2.3 检查URL配置是否已存在")
+        # 标准格式、双引号格式和include写法由同一个正则一次扫描，注释行不计
+        duplicate = get_duplicate_url_re(app_name).search(block)
+        if duplicate:
+            line = duplicate.group(1).strip()
+            print(f"! 发现已存在的URL配置: {line}")
+            return original, False, f"URL pattern for {app_name} already exists in line: {line}"
+        debug("√ 未发现重复的URL配置")
 
         # 2.4 处理特殊情况：main应用
-        print("\n# 2.4 生成URL配置")
+        debug("\n# 2.4 生成URL配置")
         if app_name == 'main':
             url_pattern = f"{indent}path('', include('main.urls')),  # 主应用作为根URL"
-            print("→ 生成main应用根URL配置")
+            debug("→ 生成main应用根URL配置")
         else:
             url_pattern = f"{indent}path('{app_name}/', include('{app_name}.urls')),"
-            print("→ 生成标准应用URL配置")
-        print(f"√ 生成的URL配置: {url_pattern}")
+            debug("→ 生成标准应用URL配置")
+        debug(f"√ 生成的URL配置: {url_pattern}")
 
         # 2.5 插入新配置
-        print("\n# 2.5 插入新配置")
-        lines.insert(end_index, url_pattern)
-        print(f"√ 在第{end_index + 1}行插入新配置")
-        new_content = '\n'.join(lines)
+        debug("\n# 2.5 插入新配置")
+        new_content = f"{content[:end_start]}{url_pattern}\n{content[end_start:]}"
+        debug(f"√ 在第{end_index + 1}行插入新配置")
 
         # 2.6 验证结果
-        print("\n# 2.6 结果验证")
+        debug("\n# 2.6 结果验证")
         valid, msg = validate_main_urls_result(new_content)
         if not valid:
             print(f"× 结果验证失败: {msg}")
-            return content, False, f"Post-validation failed: {msg}"
-        print("√ 结果验证通过")
+            return original, False, f"Post-validation failed: {msg}"
+        debug("√ 结果验证通过")
 
-        print("\n# 最终结果")
+        debug("\n# 最终结果")
         print("√ URL配置更新成功")
         return new_content, True, url_pattern
 
     except Exception as e:
         print(f"\n× 处理过程出现异常: {str(e)}")
-        return content, False, f"Error during modification: {str(e)}"
+        return original, False, f"Error during modification: {str(e)}"
 
 
 def validate_main_urls_content(content):
     """验证main urls文件的基本格式"""
-    print("\n## 验证URLs内容基本格式")
+    debug("\n## 验证URLs内容基本格式")
     if not content.strip():
         print("× 文件内容为空")
         return False, "Empty content"
     if 'urlpatterns' not in content:
         print("× 未找到urlpatterns定义")
         return False, "No urlpatterns found"
-    print("√ 基本格式验证通过")
+    debug("√ 基本格式验证通过")
     return True, ""
 
 
-def validate_main_urls_syntax(content):
-    """验证main urls文件的Python语法"""
-    print("\n## 验证URLs Python语法")
-    try:
-        compile(content, '<string>', 'exec')
-        print("√ Python语法验证通过")
-        return True, ""
-    except SyntaxError as e:
-        print(f"× Python语法错误: {str(e)}")
-        return False, str(e)
-
-
 def validate_main_urls_result(new_content):
     """验证main urls文件修改后的内容"""
-    print("\n## 验证URLs更新结果")
+    import ast
+    debug("\n## 验证URLs更新结果")
     try:
         # 1. 检查基本结构
         if 'urlpatterns' not in new_content:
             print("× urlpatterns在更新后丢失")
             return False, "urlpatterns lost after modification"
-        print("√ 基本结构完整")
+        debug("√ 基本结构完整")
 
-        # 2. 检查语法
-        compile(new_content, '<string>', 'exec')
-        print("√ 更新后的Python语法正确")
+        # 2. 检查语法（修改前后的语法检查合并到这里，只解析一次）
+        ast.parse(new_content)
+        debug("√ 更新后的Python语法正确")
 
         # 3. 检查关键导入
         if 'from django.urls import' not in new_content:
@@ -2798,13 +3161,7 @@ def validate_main_urls_result(new_content):
             print("× django.urls导入中缺少必要的组件(path或include)")
             return False, "Missing required components in django.urls import"
 
-        print("√ 所有必要的导入语句都存在")
-
-        # 4. 检查格式
-        if new_content.count('[') != new_content.count(']'):
-            print("× 方括号数量不匹配")
-            return False, "Bracket mismatch"
-        print("√ 代码格式正确")
+        debug("√ 所有必要的导入语句都存在")
 
         return True, ""
     except Exception as e:
@@ -2813,39 +3170,32 @@ def validate_main_urls_result(new_content):
 
 
 def update_main_urls(app_name, restore=False):
-    """更新或恢复 Django 项目的 URL 配置"""
-    from datetime import datetime
+    """更新或恢复 Django 项目的 URL 配置
+
+    app_name可以是单个应用名或应用名列表；传入列表时所有应用共用一次备份，
+    并只读写一次urls.py。所有应用都添加成功时返回True。
+    """
     print("\n=== URLs配置更新过程 ===")
 
     urls_path = 'config/urls.py'
     _, urls_backup_dir = get_backup_paths()
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_path = f'{urls_backup_dir}/urls.py.{timestamp}.bak'
 
     # 备份目录已在get_backup_paths中创建
-    print(f"√ 使用备份目录: {urls_backup_dir}")
+    debug(f"√ 使用备份目录: {urls_backup_dir}")
 
     # 获取最新的备份文件
     def get_latest_backup():
-        if os.path.exists(urls_backup_dir):
-            backups = sorted([f for f in os.listdir(urls_backup_dir)
-                              if f.startswith('urls.py.') and f.endswith('.bak')],
-                             reverse=True)
-            if backups:
-                latest = f'{urls_backup_dir}/{backups[0]}'
-                return latest
-            return None
-        return None
+        return get_latest_backup_file(urls_backup_dir, 'urls.py.')
 
     # 处理恢复操作
     if restore:
         latest_backup = get_latest_backup()
         if latest_backup:
             try:
-                with open(latest_backup, 'r', encoding='utf-8') as f:
-                    backup_content = f.read()
-                with open(urls_path, 'w', encoding='utf-8') as f:
-                    f.write(backup_content)
+                backup_content = read_text_file(latest_backup)
+                replace_text_file(urls_path, backup_content)
                 print(f"? 已恢复URL配置文件至备份: {latest_backup}")
                 return True
             except Exception as e:
@@ -2856,55 +3206,62 @@ def update_main_urls(app_name, restore=False):
             return False
 
     try:
-        print("\n# 开始更新配置")
+        debug("\n# 开始更新配置")
         # 1. 创建新的备份
+        original_content = None
         if os.path.exists(urls_path):
-            print(f"→ 发现现有配置文件: {urls_path}")
+            debug(f"→ 发现现有配置文件: {urls_path}")
             try:
-                with open(urls_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-                print("√ 读取现有配置成功")
-
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    f.write(original_content)
-                print(f"√ 创建备份成功: {backup_path}")
+                original_data = Path(urls_path).read_bytes()
+                original_content = decode_text(original_data)
+                debug("√ 读取现有配置成功")
+
+                identical_backup = find_identical_backup(urls_backup_dir, 'urls.py.', original_data)
+                if identical_backup:
+                    # 内容未变化时沿用最新备份，恢复结果相同
+                    print(f"√ 配置文件与最新备份相同，沿用备份: {identical_backup}")
+                else:
+                    Path(backup_path).write_bytes(original_data)
+                    print(f"√ 创建备份成功: {backup_path}")
             except Exception as e:
                 print(f"! 备份过程出现问题: {str(e)}")
                 raise e
 
-        # 2. 读取当前配置
-        print("\n# 读取当前配置")
+        # 2. 读取当前配置（备份时已读取则直接复用）
+        debug("\n# 读取当前配置")
         try:
-            with open(urls_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            print("√ 读取当前配置成功")
+            if original_content is None:
+                original_content = read_text_file(urls_path)
+            content = original_content
+            debug("√ 读取当前配置成功")
         except Exception as e:
             print(f"× 读取配置文件失败: {str(e)}")
             raise e
 
-        # 3. 处理内容
-        print("\n# 开始处理配置内容")
-        new_content, has_update, url_pattern = append_url_to_main_urls(content, app_name)
-
-        if has_update:
-            print("\n# 准备写入更新")
-            print(f"→ 新的URL配置: {url_pattern}")
+        # 3. 处理内容：多个应用依次在内存中追加，最后只写一次
+        debug("\n# 开始处理配置内容")
+        app_names = [app_name] if isinstance(app_name, str) else list(app_name)
+        new_content = content
+        added_patterns = []
+        for name in app_names:
+            new_content, has_update, url_pattern = append_url_to_main_urls(new_content, name)
+            if has_update:
+                added_patterns.append(url_pattern)
+
+        if added_patterns:
+            debug("\n# 准备写入更新")
+            for url_pattern in added_patterns:
+                print(f"→ 新的URL配置: {url_pattern}")
 
             # 4. 写入更新后的内容
             try:
-                with open(urls_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                replace_text_file(urls_path, new_content)
                 print("√ 写入更新成功")
-                return True
+                return len(added_patterns) == len(app_names)
             except Exception as write_err:
                 print(f"× 写入更新失败: {str(write_err)}")
-                # 5. 如果写入失败，恢复备份
-                print("! 尝试恢复备份")
-                with open(backup_path, 'r', encoding='utf-8') as f:
-                    backup_content = f.read()
-                with open(urls_path, 'w', encoding='utf-8') as f:
-                    f.write(backup_content)
-                print("√ 已恢复至备份状态")
+                # 5. 原子替换失败时原文件保持不变，无需恢复
+                print("! 原配置文件未被修改")
                 raise write_err
         else:
             print("\n! 内容无需更新")
@@ -2917,32 +3274,90 @@ def update_main_urls(app_name, restore=False):
         if latest_backup:
             print("! 尝试从最新备份恢复")
             try:
-                with open(latest_backup, 'r', encoding='utf-8') as f:
-                    backup_content = f.read()
-                with open(urls_path, 'w', encoding='utf-8') as f:
-                    f.write(backup_content)
+                backup_content = read_text_file(latest_backup)
+                replace_text_file(urls_path, backup_content)
                 print("√ 已自动恢复至备份状态")
             except Exception as restore_err:
                 print(f"× 恢复备份失败: {str(restore_err)}")
         return False
 
-def verify_app_files(app_name, project_name, base_dir):
-    """验证应用的关键配置文件内容"""
+
+# views.py必须包含的基本结构，直接在文件原始字节中做子串查找，无需解码
+REQUIRED_VIEWS_ELEMENTS = (
+    'from django.shortcuts import render',
+    'def index(request):',
+    'context = {',
+    'return render(request,',
+)
+_REQUIRED_VIEWS_BYTES = tuple(element.encode('utf-8') for element in REQUIRED_VIEWS_ELEMENTS)
+
+
+def content_matches(data, expected):
+    """比较文件原始字节与期望内容（忽略首尾空白）
+
+    expected为已strip并编码的期望内容。直接比较字节，省去解码和换行符转换；
+    字节不一致时（如CRLF换行）再按文本比较。
+    """
+    if data.strip() == expected:
+        return True
+    return decode_text(data).strip() == expected.decode('utf-8')
+
+
+def get_file_signature(paths):
+    """返回各文件的(路径, 修改时间)元组，文件变化时签名随之变化"""
+    signature = []
+    for path in paths:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        signature.append((str(path), mtime))
+    return tuple(signature)
+
+
+def verify_project_urls_imports(base_dir):
+    """验证项目config/urls.py中的导入语句
+
+    各应用共用同一个项目urls.py，结果按文件修改时间缓存，
+    文件未变化时多个应用的验证只读取一次。
+    """
+    urls_path = Path(base_dir) / 'config' / 'urls.py'
+    return list(_verify_project_urls_imports(urls_path, get_file_signature((urls_path,))))
+
+
+@functools.lru_cache(maxsize=None)
+def _verify_project_urls_imports(urls_path, signature):
+    """verify_project_urls_imports的实际实现，signature只参与缓存键"""
     try:
-        # 定义需要验证的文件及其结构
-        def verify_views_structure(content):
-            """验证views.py文件的基本结构"""
-            required_elements = [
-                'from django.shortcuts import render',
-                'def index(request):',
-                'context = {',
-                'return render(request,'
-            ]
-            return all(element in content for element in required_elements)
-
-        # 定义需要验证的文件及其预期内容模板
-        files_to_verify = {
-            'urls.py': f'''"""
+        urls_content = read_text_file(urls_path)
+    except FileNotFoundError:
+        return ()
+    except Exception as e:
+        return ((str(e), False, "验证过程出错"),)
+
+    has_path_import = 'from django.urls import path' in urls_content
+    has_include_import = 'include' in urls_content
+    if has_path_import and has_include_import:
+        return (('project_urls_imports', True, "URL导入语句配置正确"),)
+    missing = []
+    if not has_path_import:
+        missing.append('path')
+    if not has_include_import:
+        missing.append('include')
+    return (('project_urls_imports', False, f"缺少必要的导入: {', '.join(missing)}"),)
+
+
+@functools.lru_cache(maxsize=512)
+def get_expected_app_files(app_name):
+    """返回需要逐字节比对的应用文件及其期望内容（按应用名缓存）
+
+    期望内容已strip并编码为字节，校验多个应用或重复校验时不再重新渲染模板。
+    """
+    class_name = app_name.title().replace('_', '')
+    verbose_title = app_name.title().replace('_', ' ')
+
+    files_to_verify = {
+        'urls.py': f'''"""
 File: apps/{app_name}/urls.py
 Purpose: {app_name}应用的URL配置
 """
@@ -2956,7 +3371,7 @@ urlpatterns = [
     path('', views.index, name='index'),
 ]
 ''',
-            'apps.py': f'''"""
+        'apps.py': f'''"""
 File: apps/{app_name}/apps.py
 Purpose: {app_name}应用的配置类
 Warning: 此文件由系统自动生成，请勿手动修改
@@ -2964,78 +3379,72 @@ Warning: 此文件由系统自动生成，请勿手动修改
 
 from django.apps import AppConfig
 
-class {app_name.title().replace('_', '')}Config(AppConfig):
+class {class_name}Config(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.{app_name}'
-    verbose_name = '{app_name.title().replace("_", " ")}模块'
+    verbose_name = '{verbose_title}模块'
 '''
-        }
+    }
+    return tuple((filename, content.strip().encode('utf-8'))
+                 for filename, content in files_to_verify.items())
+
+
+def verify_app_files(app_name, project_name, base_dir):
+    """验证应用的关键配置文件内容
+
+    项目级的urls.py导入检查与应用自身文件的检查分开缓存，
+    均按相关文件的修改时间失效，文件未变化时不再重新读取比对。
+    """
+    app_dir = Path(base_dir) / 'apps' / app_name
+    signature = get_file_signature((app_dir / 'urls.py', app_dir / 'apps.py', app_dir / 'views.py'))
+    return (verify_project_urls_imports(base_dir)
+            + list(_verify_app_files(app_name, project_name, app_dir, signature)))
+
+
+@functools.lru_cache(maxsize=None)
+def _verify_app_files(app_name, project_name, app_dir, signature):
+    """验证应用自身文件的实际实现，signature只参与缓存键"""
+    try:
+        def verify_views_structure(entry):
+            """验证views.py文件的基本结构，缺少任一元素时立即返回"""
+            data = Path(entry.path).read_bytes()
+            return all(element in data for element in _REQUIRED_VIEWS_BYTES)
 
         verification_results = []
 
-        # 验证项目URLs文件中的导入语句
-        project_urls_path = base_dir / 'config' / 'urls.py'
-        if project_urls_path.exists():
-            with open(project_urls_path, 'r', encoding='utf-8') as f:
-                urls_content = f.read()
-                has_path_import = 'from django.urls import path' in urls_content
-                has_include_import = 'include' in urls_content
-                if has_path_import and has_include_import:
-                    verification_results.append(('project_urls_imports', True, "URL导入语句配置正确"))
-                else:
-                    missing = []
-                    if not has_path_import:
-                        missing.append('path')
-                    if not has_include_import:
-                        missing.append('include')
-                    verification_results.append(('project_urls_imports', False,
-                                                 f"缺少必要的导入: {', '.join(missing)}"))
-
-        for filename, expected_content in files_to_verify.items():
-            file_path = base_dir / 'apps' / app_name / filename
-            if not file_path.exists():
+        # 一次列出应用目录，之后的存在性判断只做字典查找
+        try:
+            with os.scandir(app_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            entries = {}
+
+        # 逐个比对期望文件：文件比strip后的期望内容还短时必然不一致，无需读取；
+        # 否则读取原始字节比较（首尾空白多少不限）
+        for filename, expected in get_expected_app_files(app_name):
+            entry = entries.get(filename)
+            if entry is None:
                 verification_results.append((filename, False, "文件不存在"))
                 continue
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                actual_content = f.read()
-                content_matches = actual_content.strip() == expected_content.strip()
-                if content_matches:
-                    verification_results.append((filename, True, "内容正确"))
-                else:
-                    verification_results.append((filename, False, "内容不匹配期望值"))
-
-        # 特殊处理views.py的验证
-        views_path = base_dir / 'apps' / app_name / 'views.py'
-        if views_path.exists():
-            with open(views_path, 'r', encoding='utf-8') as f:
-                views_content = f.read()
-                if verify_views_structure(views_content):
-                    verification_results.append(('views.py', True, "结构正确"))
-                else:
-                    verification_results.append(('views.py', False, "基本结构不符合要求"))
-        else:
+            if (entry.stat().st_size >= len(expected)
+                    and content_matches(Path(entry.path).read_bytes(), expected)):
+                verification_results.append((filename, True, "内容正确"))
+            else:
+                verification_results.append((filename, False, "内容不匹配期望值"))
+
+        # 特殊处理views.py的验证：只检查必需元素，按原始字节查找
+        views_entry = entries.get('views.py')
+        if views_entry is None:
             verification_results.append(('views.py', False, "文件不存在"))
+        elif verify_views_structure(views_entry):
+            verification_results.append(('views.py', True, "结构正确"))
+        else:
+            verification_results.append(('views.py', False, "基本结构不符合要求"))
 
-        return verification_results
+        return tuple(verification_results)
     except Exception as e:
-        return [(str(e), False, "验证过程出错")]
-
-
-def check_app_exists(app_name, base_dir=None):
-    """检查应用是否已存在
-
-    Args:
-        app_name (str): 应用名称
-        base_dir (Path, optional): 项目根目录. 默认为当前目录
-
-    Returns:
-        bool: 如果应用已存在返回True，否则返回False
-    """
-    if base_dir is None:
-        base_dir = Path.cwd()
-    app_dir = base_dir / 'apps' / app_name
-    return app_dir.exists()
+        return ((str(e), False, "验证过程出错"),)
 
 
 def filter_new_apps(app_names, base_dir=None):
@@ -3050,6 +3459,15 @@ def filter_new_apps(app_names, base_dir=None):
             - new_apps: 不存在的应用列表
             - duplicate_apps: 已存在的应用列表
     """
+    if base_dir is None:
+        base_dir = Path.cwd()
+    # 一次列出apps目录，之后逐个应用只做集合查找
+    try:
+        with os.scandir(base_dir / 'apps') as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        existing = set()
+
     new_apps = []
     duplicate_apps = []
     forbidden_apps = []
@@ -3057,16 +3475,16 @@ def filter_new_apps(app_names, base_dir=None):
     for app_name in app_names:
         if app_name in FORBIDDEN_APP_NAMES:
             forbidden_apps.append(app_name)
-        elif check_app_exists(app_name, base_dir):
+        elif os.path.normcase(app_name) in existing:
             duplicate_apps.append(app_name)
         else:
             new_apps.append(app_name)
 
     return new_apps, duplicate_apps, forbidden_apps
 
-def get_logging_config_template():
-   """生成日志配置模板"""
-   return '''# config/settings/logging_config.py
+
+# config/settings/logging_config.py的模板，$app_loggers处填入各应用的logger配置
+LOGGING_CONFIG_PY = Template('''# config/settings/logging_config.py
 
 import os
 from datetime import datetime
@@ -3078,128 +3496,134 @@ if not os.path.exists(LOG_DIR):
 
 # 日志文件命名格式
 def get_log_filename(prefix):
-   return os.path.join(LOG_DIR, f'{{prefix}}_{{datetime.now().strftime("%Y%m%d")}}.log')
+   return os.path.join(LOG_DIR, f'{prefix}_{datetime.now().strftime("%Y%m%d")}.log')
 
 # Django 日志配置
-LOGGING = {{
+LOGGING = {
    'version': 1,
    'disable_existing_loggers': False,
    # 日志格式定义
-   'formatters': {{
+   'formatters': {
        # 详细格式，包含时间、日志级别、模块、进程号、线程号和消息
-       'verbose': {{
-           'format': '{{levelname}} {{asctime}} {{module}} {{process:d}} {{thread:d}} {{message}}',
-           'style': '{{',
-       }},
+       'verbose': {
+           'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+           'style': '{',
+       },
        # 简单格式，仅包含日志级别和消息
-       'simple': {{
-           'format': '{{levelname}} {{message}}',
-           'style': '{{',
-       }},
+       'simple': {
+           'format': '{levelname} {message}',
+           'style': '{',
+       },
        # 标准格式，包含时间、日志级别、名称、行号和消息
-       'standard': {{
+       'standard': {
            'format': '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)s] %(message)s',
            'datefmt': '%Y-%m-%d %H:%M:%S'
-       }},
-   }},
+       },
+   },
    # 日志过滤器定义
-   'filters': {{
+   'filters': {
        # 仅在DEBUG=True时允许
-       'require_debug_true': {{
+       'require_debug_true': {
            '()': 'django.utils.log.RequireDebugTrue',
-       }},
+       },
        # 仅在DEBUG=False时允许
-       'require_debug_false': {{
+       'require_debug_false': {
            '()': 'django.utils.log.RequireDebugFalse',
-       }},
-   }},
+       },
+   },
    # 日志处理器定义
-   'handlers': {{
+   'handlers': {
        # 控制台输出处理器 - 仅在DEBUG=True时生效
-       'console': {{
+       'console': {
            'level': 'INFO',
            'filters': ['require_debug_true'],
            'class': 'logging.StreamHandler',
            'formatter': 'simple'
-       }},
+       },
        # 管理员邮件通知 - 仅在DEBUG=False时生效，用于生产环境错误通知
-       'mail_admins': {{
+       'mail_admins': {
            'level': 'ERROR',
            'filters': ['require_debug_false'],
            'class': 'django.utils.log.AdminEmailHandler'
-       }},
+       },
        # 调试级别日志文件 - 5MB大小限制，保留5个备份
-       'file_debug': {{
+       'file_debug': {
            'level': 'DEBUG',
            'class': 'logging.handlers.RotatingFileHandler',
            'filename': get_log_filename('debug'),
            'maxBytes': 1024*1024*5,  # 5 MB
            'backupCount': 5,
            'formatter': 'standard',
-       }},
+       },
        # 信息级别日志文件 - 5MB大小限制，保留5个备份
-       'file_info': {{
+       'file_info': {
            'level': 'INFO',
            'class': 'logging.handlers.RotatingFileHandler',
            'filename': get_log_filename('info'),
            'maxBytes': 1024*1024*5,  # 5 MB
            'backupCount': 5,
            'formatter': 'standard',
-       }},
+       },
        # 错误级别日志文件 - 5MB大小限制，保留5个备份
-       'file_error': {{
+       'file_error': {
            'level': 'ERROR',
            'class': 'logging.handlers.RotatingFileHandler',
            'filename': get_log_filename('error'),
            'maxBytes': 1024*1024*5,  # 5 MB
            'backupCount': 5,
            'formatter': 'standard',
-       }},
-   }},
+       },
+   },
    # 日志记录器定义
-   'loggers': {{
+   'loggers': {
        # Django框架相关日志
-       'django': {{
+       'django': {
            'handlers': ['console', 'file_info', 'mail_admins'],
            'level': 'INFO',
            'propagate': True,  # 允许日志传播到父记录器
-       }},
+       },
        # Django服务器相关日志
-       'django.server': {{
+       'django.server': {
            'handlers': ['console', 'file_info'],
            'level': 'INFO',
            'propagate': False,  # 不传播日志到父记录器
-       }},
+       },
        # Django请求处理相关日志
-       'django.request': {{
+       'django.request': {
            'handlers': ['mail_admins', 'file_error'],
            'level': 'ERROR',
            'propagate': False,
-       }},
+       },
        # Django数据库操作相关日志
-       'django.db.backends': {{
+       'django.db.backends': {
            'handlers': ['file_debug'],
            'level': 'DEBUG' if os.getenv('DEBUG_DB', 'False') == 'True' else 'INFO',
            'propagate': False,
-       }},
-{app_loggers}
-   }}
-}}'''
+       },
+${app_loggers}
+   }
+}''')
 
-def get_app_logger_config(app_name):
-    """生成应用特定的日志配置"""
-    return f'''        # {app_name}应用日志
-        '{app_name}': {{
+
+# 单个应用的logger配置模板
+APP_LOGGER_CONFIG = Template('''        # ${app_name}应用日志
+        '${app_name}': {
             'handlers': ['console', 'file_info', 'file_error'],
             'level': 'INFO',
             'propagate': True,
-        }},
-        # {app_name} API日志
-        '{app_name}.api': {{
+        },
+        # ${app_name} API日志
+        '${app_name}.api': {
             'handlers': ['console', 'file_info', 'file_error'],
             'level': 'INFO',
             'propagate': False,
-        }},'''
+        },''')
+
+
+@functools.lru_cache(maxsize=None)
+def get_app_logger_config(app_name):
+    """生成应用特定的日志配置（纯字符串渲染，按应用名缓存）"""
+    return APP_LOGGER_CONFIG.substitute(app_name=app_name)
 
 
 def get_django_rest_api_lightweight_specification_and_implementation_guide():
@@ -3787,58 +4211,95 @@ your_app/
 注：本文档为精简版，完整版请参考 django_rest_api_lightweight_specification_and_implementation_guide.md
 '''
 
+# 驼峰转下划线用的预编译正则：先拆开"大写+小写"单词，再拆开小写/数字后紧跟的大写字母
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+
+
+@functools.lru_cache(maxsize=64)
 def normalize_app_name(app_name):
     """
-    规范化应用名称
+    规范化应用名称（结果按应用名缓存）
     - 输入可以是任何形式（下划线或驼峰）
     - 输出符合Django命名规范（小写+下划线）
     """
     # 先将驼峰转换为下划线形式
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', app_name)
-    normalized = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r'\1_\2', app_name)
+    normalized = _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
     return normalized
 
+@functools.lru_cache(maxsize=256)
 def get_app_class_name(app_name):
     """
-    获取应用配置类名称（PascalCase）
+    获取应用配置类名称（PascalCase，结果按应用名缓存）
     """
     return ''.join(word.title() for word in app_name.split('_'))
 
+@functools.lru_cache(maxsize=64)
+def get_app_config_ref(app_name):
+    """
+    获取应用配置类的引用字符串，如 blog.apps.BlogConfig（结果缓存，避免重复title()）
+    """
+    return f"{app_name}.apps.{app_name.title()}Config"
+
+def write_development_guide(output_path):
+    """将应用开发指南写入指定文件"""
+    output_path = Path(output_path)
+    try:
+        # 指南字节在模块加载时已编码，直接写出
+        output_path.write_bytes(APP_DEVELOPMENT_GUIDE_DATA)
+        print(f"\n✓ 开发指南已生成: {output_path}")
+        return True
+    except Exception as e:
+        print(f"\n✗ 开发指南生成失败: {str(e)}")
+        return False
+
+
 def main():
-    """主函数：处理参数并根据模式执行相应操作"""
+    """主函数：处理参数并根据模式执行相应操作
+
+    Returns:
+        bool: 是否成功创建了项目或应用；只生成指南、恢复配置、没有新应用等情况
+            返回False，此时无需再执行后续的Django命令
+    """
+    # 只输出开发指南时跳过完整的参数解析
+    guide_output = get_guide_only_output(sys.argv[1:])
+    if guide_output is not None:
+        write_development_guide(guide_output)
+        return False
+
+    # 启动时获取一次当前目录，后续统一使用，避免重复getcwd
+    cwd = Path.cwd()
+
     # 解析参数
-    args = parse_arguments()
+    args = parse_arguments(cwd)
+    global DEBUG_VERBOSE
+    DEBUG_VERBOSE = args.verbose
 
     # 优先检查应用名称是否合法
     if args.apps:
         has_forbidden, forbidden_names, suggestions = check_forbidden_app_names(args.apps)
         if has_forbidden:
-            print("\n× 错误: 检测到使用了禁止的应用名称!")
-            print("\n以下应用名称不能使用，因为它们是Django的内置应用:")
+            # 错误说明整段缓冲后一次写出
+            log("\n× 错误: 检测到使用了禁止的应用名称!")
+            log("\n以下应用名称不能使用，因为它们是Django的内置应用:")
             for name in forbidden_names:
-                print(f"  - {name}")
+                log(f"  - {name}")
                 if name in suggestions:
-                    print(f"    建议使用: {', '.join(suggestions[name])}")
-            print("\n请使用其他名称重新运行命令。")
+                    log(f"    建议使用: {', '.join(suggestions[name])}")
+            log("\n请使用其他名称重新运行命令。")
+            flush_log()
             return False
 
     # 优先处理guide参数
     if args.guide:
-        guide_content = get_app_development_guide()
-        output_path = Path(args.guide_output)
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(guide_content)
-            print(f"\n✓ 开发指南已生成: {output_path}")
-            return True
-        except Exception as e:
-            print(f"\n✗ 开发指南生成失败: {str(e)}")
-            return False
+        write_development_guide(args.guide_output)
+        return False
 
     # 优先处理restore参数
     if args.restore:
         print("\n=== 开始执行配置恢复 ===")
-        if not check_project_exists(args.project):
+        if not check_project_exists(args.project, cwd):
             print(f"\n× 错误: 项目 {args.project} 不存在!")
             print("提示: 恢复配置需要在已存在的项目中执行")
             return False
@@ -3850,16 +4311,19 @@ def main():
         settings_restored = update_base_settings('', restore=True)
         urls_restored = update_main_urls('', restore=True)
 
-        # 输出恢复结果
-        print("\n=== 配置恢复结果 ===")
-        print(f"INSTALLED_APPS配置: {'✓ 已恢复' if settings_restored else '× 恢复失败'}")
-        print(f"URL配置: {'✓ 已恢复' if urls_restored else '× 恢复失败'}")
-        print("\n=== 配置恢复执行完成 ===")
-        return settings_restored and urls_restored
+        # 输出恢复结果（整段缓冲后一次写出）
+        log("\n=== 配置恢复结果 ===")
+        log(f"INSTALLED_APPS配置: {'✓ 已恢复' if settings_restored else '× 恢复失败'}")
+        log(f"URL配置: {'✓ 已恢复' if urls_restored else '× 恢复失败'}")
+        log("\n=== 配置恢复执行完成 ===")
+        flush_log()
+        # 恢复配置不创建项目或应用，无需执行后续的Django命令
+        return False
 
     # 以下是原有的初始化和添加应用的逻辑
     project_name = args.project
-    project_exists = check_project_exists(project_name)
+    project_dir = cwd / project_name
+    project_exists = check_project_exists(project_name, cwd)
 
     global INITIAL_APPS
 
@@ -3870,30 +4334,31 @@ def main():
             print("提示: 如果要在现有项目中添加应用，请使用 --mode add")
             return False
 
-        # 确定应用列表
+        # 确定应用列表；命令行指定的应用名在开头已检查过禁止名称，
+        # 这里只需检查默认的INITIAL_APPS，不再重复扫描一遍
         if args.apps is not None:
             INITIAL_APPS = args.apps
-
-        # 只检查禁止的应用名
-        has_forbidden, forbidden_names, suggestions = check_forbidden_app_names(INITIAL_APPS)
-        if has_forbidden:
-            print("\n× 错误: 检测到使用了禁止的应用名称!")
-            for name in forbidden_names:
-                print(f"  - {name}")
-                if name in APP_NAME_SUGGESTIONS:
-                    print(f"    建议使用: {', '.join(APP_NAME_SUGGESTIONS[name])}")
-            return False
+        else:
+            has_forbidden, forbidden_names, suggestions = check_forbidden_app_names(INITIAL_APPS)
+            if has_forbidden:
+                log("\n× 错误: 检测到使用了禁止的应用名称!")
+                for name in forbidden_names:
+                    log(f"  - {name}")
+                    if name in APP_NAME_SUGGESTIONS:
+                        log(f"    建议使用: {', '.join(APP_NAME_SUGGESTIONS[name])}")
+                flush_log()
+                return False
 
         # 创建项目目录结构
-        success = create_project_structure(project_name)
+        success = create_project_structure(project_name, cwd)
         print('++++++++++++++++++++++++++++++++++++++++++++++++++')
         print(f'create_project_structure return {success}')
         print('++++++++++++++++++++++++++++++++++++++++++++++++++')
 
         if success:
-            # 创建初始应用
-            for app_name in INITIAL_APPS:
-                create_app_structure(app_name, project_name, Path.cwd())
+            # 后续的Django命令在项目目录中执行
+            os.chdir(project_dir)
+            # 项目目录此前不存在，初始应用已由create_project_structure并行创建，无需再扫描一遍
             return True
         return False
 
@@ -3903,18 +4368,20 @@ def main():
             INITIAL_APPS = args.apps if args.apps is not None else INITIAL_APPS
 
             # 创建项目目录结构
-            create_project_structure(project_name)
+            create_project_structure(project_name, cwd)
+            os.chdir(project_dir)
 
             # 检测重复应用和禁止应用
-            new_apps, duplicate_apps, forbidden_apps = filter_new_apps(INITIAL_APPS)
+            new_apps, duplicate_apps, forbidden_apps = filter_new_apps(INITIAL_APPS, project_dir)
 
             if forbidden_apps:
-                print("\n× 错误: 以下应用名称是Django内置应用，不能使用:")
+                log("\n× 错误: 以下应用名称是Django内置应用，不能使用:")
                 for name in forbidden_apps:
-                    print(f"  - {name}")
+                    log(f"  - {name}")
                     if name in APP_NAME_SUGGESTIONS:
-                        print(f"    建议使用: {', '.join(APP_NAME_SUGGESTIONS[name])}")
-                print("\n请使用其他名称重新运行命令。")
+                        log(f"    建议使用: {', '.join(APP_NAME_SUGGESTIONS[name])}")
+                log("\n请使用其他名称重新运行命令。")
+                flush_log()
                 return False
 
             if not new_apps:
@@ -3931,7 +4398,7 @@ def main():
                 print("\n! 以下应用已存在，将跳过处理:")
                 print("  ", ", ".join(duplicate_apps))
 
-            success = initialize_django_project(project_name)
+            success = initialize_django_project(project_name, cwd)
             return success
         else:
             if not args.apps:
@@ -3942,13 +4409,13 @@ def main():
             os.chdir(project_name)
 
             # 检查apps目录
-            apps_dir = Path.cwd() / 'apps'
+            apps_dir = project_dir / 'apps'
             if not apps_dir.exists():
                 print("\n× 错误: apps目录不存在，请检查项目结构")
                 return False
 
             # 检测重复应用
-            new_apps, duplicate_apps, forbidden_apps = filter_new_apps(args.apps)
+            new_apps, duplicate_apps, forbidden_apps = filter_new_apps(args.apps, project_dir)
 
             if not new_apps:
                 print("\n! 注意: 所有指定的应用都已存在，跳过处理")
@@ -3961,89 +4428,120 @@ def main():
                 print("\n! 以下应用已存在，将跳过处理:")
                 print("  ", ", ".join(duplicate_apps))
 
-            success = True
-            # 创建新应用
-            for app_name in new_apps:
-                app_success = create_app_structure(app_name, project_name, Path.cwd())
-                if not app_success:
-                    success = False
-                    continue
-
-                print(f"\n√ 应用 {app_name} 创建成功!")
-
+            # 第一阶段：并行创建各应用的目录结构
+            app_results = create_app_structures(new_apps, project_name, project_dir)
+            created_apps = [app_name for app_name, app_success in zip(new_apps, app_results) if app_success]
+            success = len(created_apps) == len(new_apps)
+            for app_name in created_apps:
+                log(f"\n√ 应用 {app_name} 创建成功!")
+            flush_log()
+
+            if not created_apps:
+                return success
+
+            # 第二阶段：base.py和urls.py对所有新应用只各备份、改写一次
+            if args.auto_update:
+                print("\n=== 开始自动更新配置 ===")
+                settings_updated = update_base_settings(created_apps)
+                urls_updated = update_main_urls(created_apps)
+                logging_updated = add_app_logger_config(created_apps)
+
+            # 各应用的文件校验只读且相互独立：先在线程池中并行跑一遍，结果按文件签名缓存，
+            # 下面逐个生成配置指南时直接命中缓存；配置文件的改写仍保持串行
+            with ThreadPoolExecutor(max_workers=min(MAX_APP_WORKERS, len(created_apps))) as executor:
+                list(executor.map(functools.partial(verify_app_files, project_name=project_name,
+                                                    base_dir=project_dir),
+                                  created_apps))
+
+            for app_name in created_apps:
                 if args.auto_update:
-                    print("\n=== 开始自动更新配置 ===")
-                    settings_updated = update_base_settings(app_name)
-                    urls_updated = update_main_urls(app_name)
-                    logging_updated = add_app_logger_config(app_name)
-
                     if not (settings_updated and urls_updated and logging_updated):
                         success = False
 
-                    print("\n=== 配置更新结果 ===")
-                    print(f"INSTALLED_APPS配置: {'✓ 已更新' if settings_updated else '× 更新失败'}")
-                    print(f"URL配置: {'✓ 已更新' if urls_updated else '× 更新失败'}")
-                    print(f"日志配置: {'✓ 已更新' if logging_updated else '× 更新失败'}")
+                    log(f"\n=== {app_name} 配置更新结果 ===")
+                    log(f"INSTALLED_APPS配置: {'✓ 已更新' if settings_updated else '× 更新失败'}")
+                    log(f"URL配置: {'✓ 已更新' if urls_updated else '× 更新失败'}")
+                    log(f"日志配置: {'✓ 已更新' if logging_updated else '× 更新失败'}")
+                    flush_log()
 
-                    generate_manual_config_guide(app_name, project_name, Path.cwd(), auto_updated=True)
+                    generate_manual_config_guide(app_name, project_name, project_dir, auto_updated=True)
                 else:
-                    generate_manual_config_guide(app_name, project_name, Path.cwd(), auto_updated=False)
+                    generate_manual_config_guide(app_name, project_name, project_dir, auto_updated=False)
 
             return success
 
     return True
 
 
+# 项目创建后需要执行的Django管理命令（与manage.py使用相同的默认settings）
+DJANGO_COMMANDS_SCRIPT = """
+import os
+import django
+from django.core.management import call_command
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+call_command('migrate')
+call_command('check')
+"""
+
+
 def execute_django_commands():
     """执行Django必要的初始化命令"""
+    import subprocess
     print("\n开始执行Django初始化命令...")
     try:
         current_dir = os.getcwd()
         print(f"→ 当前目录: {current_dir}")
 
-        # 检查manage.py是否存在
-        manage_py_path = os.path.join(current_dir, 'manage.py')
-        print(f"→ 检查manage.py是否存在: {'是' if os.path.exists(manage_py_path) else '否'}")
+        # 检查manage.py是否存在（只stat一次，输出和判断共用结果）
+        manage_py_exists = os.path.exists(os.path.join(current_dir, 'manage.py'))
+        print(f"→ 检查manage.py是否存在: {'是' if manage_py_exists else '否'}")
 
-        if not os.path.exists(manage_py_path):
+        if not manage_py_exists:
             print("! 未找到manage.py文件，无法执行Django命令")
             return
 
-        print("\n执行数据库迁移...")
-        result = subprocess.run([sys.executable, 'manage.py', 'migrate'],
-                                capture_output=True,
-                                text=True,
-                                check=True)
-        print(result.stdout)
-
-        print("\n检查项目配置...")
-        result = subprocess.run([sys.executable, 'manage.py', 'check'],
-                                capture_output=True,
-                                text=True,
-                                check=True)
-        print(result.stdout)
-
-        print("\n✓ Django命令执行完成!")
-        print("\n后续开发提示:")
-        print(f"1. 请先进入项目目录: cd {os.path.basename(os.getcwd())}")
-        print("2. 启动开发服务器: python manage.py runserver")
-        print("\n浏览器访问指南:")
-        print("1. 项目主页: http://127.0.0.1:8000")
-        print("2. 后台管理: http://127.0.0.1:8000/admin")
-        print("   - 需要先创建管理员账号: python manage.py createsuperuser")
-        print("   - 按提示设置用户名和密码(密码输入时不显示)")
-        print("   - 需要输入邮箱地址，格式必须是email格式(如abc@example.com)")
-        print("   - 邮箱地址不会被验证，仅作为管理员联系方式记录")
-        print("3. API浏览器: http://127.0.0.1:8000/api")
-        print("4. 其他应用URL:")
-        for app in INITIAL_APPS:
-            if app != 'main':  # main应用已经在根URL
-                print(f"   - {app.title()}模块: http://127.0.0.1:8000/{app}")
+        # migrate和check在同一个子进程中执行，只启动一次解释器、加载一次Django
+        print("\n执行数据库迁移并检查项目配置...")
+        # 按行读取子进程输出并实时转写到stdout，不在内存中缓冲全部输出
+        command = [sys.executable, '-c', DJANGO_COMMANDS_SCRIPT]
+        with subprocess.Popen(command,
+                              cwd=current_dir,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT,
+                              text=True,
+                              bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, command)
+
+        # 完成提示整段缓冲后一次写出
+        log("\n✓ Django命令执行完成!")
+        log("\n后续开发提示:")
+        log(f"1. 请先进入项目目录: cd {os.path.basename(current_dir)}")
+        log("2. 启动开发服务器: python manage.py runserver")
+        log("\n浏览器访问指南:")
+        log("1. 项目主页: http://127.0.0.1:8000")
+        log("2. 后台管理: http://127.0.0.1:8000/admin")
+        log("   - 需要先创建管理员账号: python manage.py createsuperuser")
+        log("   - 按提示设置用户名和密码(密码输入时不显示)")
+        log("   - 需要输入邮箱地址，格式必须是email格式(如abc@example.com)")
+        log("   - 邮箱地址不会被验证，仅作为管理员联系方式记录")
+        log("3. API浏览器: http://127.0.0.1:8000/api")
+        log("4. 其他应用URL:")
+        # main应用已经在根URL，其余应用的地址拼成一段文本
+        app_urls = [f"   - {app.title()}模块: http://127.0.0.1:8000/{app}"
+                    for app in INITIAL_APPS if app != 'main']
+        if app_urls:
+            log('\n'.join(app_urls))
+        flush_log()
 
     except subprocess.CalledProcessError as e:
         print(f"\n! Django命令执行失败:")
         print(f"错误代码: {e.returncode}")
-        print(f"命令输出: {e.output}")
+        print("命令输出见上方")
     except Exception as e:
         print(f"\n! 执行Django命令时出错: {str(e)}")
         print(f"错误类型: {type(e).__name__}")
@@ -4054,8 +4552,8 @@ if __name__ == '__main__':
     # 执行主程序，并获取执行结果
     success = main()
     print(f'main 函数返回值{success}')
-    # 只有在非恢复模式且主程序执行成功的情况下才执行Django命令
-    if success and not any(arg in sys.argv for arg in ['--restore']):
+    # 只有在主程序确实创建了项目或应用时才执行Django命令（恢复模式返回False）
+    if success:
         print("\n=== 项目初始化完成，准备执行Django命令 ===")
         execute_django_commands()
     print("\n=== 所有操作执行完成 ===")
\ No newline at end of file